@@ -1,17 +1,33 @@
 import tkinter as tk
 from firebase_config import db
+from nqueens.core import SOLUTION_COUNTS
 
-def check_and_reset_solutions(self):
-    total_possible_solutions = 14772512  # Replace with actual total solutions count for 16-Queens
+# Total number of solutions for an n x n board (14772512 for 16-Queens).
+# Counting them here would run minutes of search on the Tk thread, so the
+# published counts are used; count_n_queens_parallel can check them offline.
+def total_solutions(n):
+    if not 0 <= n < len(SOLUTION_COUNTS):
+        raise ValueError(f"No known solution count for n={n}")
+    return SOLUTION_COUNTS[n]
 
-    # Fetch all records from Firebase
-    records = db.collection("nqueens").get()
-    current_solution_count = len(records)
+def check_and_reset_solutions(self, catalogue=None, n=16):
+    if catalogue is not None:
+        # Count the found solutions from the catalogue bitmap
+        total_possible_solutions = len(catalogue)
+        current_solution_count = catalogue.found_count()
+    else:
+        total_possible_solutions = total_solutions(n)
+
+        # Fetch all records from Firebase
+        records = db.collection("nqueens").get()
+        current_solution_count = len(records)
 
     if current_solution_count >= total_possible_solutions:
         # Clear all records from the 'nqueens' collection
         docs = db.collection("nqueens").stream()
         for doc in docs:
             db.collection("nqueens").document(doc.id).delete()
+        if catalogue is not None:
+            catalogue.reset_found()
         # Notify players that all solutions have been reset
         tk.messagebox.showinfo("Reset Complete", "All solutions have been identified. The system has been reset for new players.")
@@ -4,52 +4,17 @@ from firebase_admin import credentials, firestore
 import re
 import time
 import tkinter.ttk as ttk 
+from solution_catalogue import open_catalogue
+from solution_rank import rank_solution
+from game_logic import NQueensGame
+from board import BoardRenderer
+from background_io import BackgroundIO
+from nqueens.hints import HintService, SOLVABLE, UNSOLVABLE
 
 class NQueensUI:
     
-    class NQueensGame:
-        def __init__(self, size):
-            self.size = size
-            self.board = [[0] * size for _ in range(size)]
-            self.queens_left = size
-            self.moves_count = 0
-            self.move_paths = []  # Store the move paths as a list of strings
-
-        def is_valid_move(self, row, col):
-            # Check the row
-            for i in range(self.size):
-                if self.board[row][i] == 1:
-                    return False
-
-            # Check the column
-            for i in range(self.size):
-                if self.board[i][col] == 1:
-                    return False
-
-            # Check the diagonals
-            for i in range(self.size):
-                for j in range(self.size):
-                    if abs(row - i) == abs(col - j) and self.board[i][j] == 1:
-                        return False
-
-            return True
-
-        def place_or_remove_queen(self, row, col):
-            if self.board[row][col] == 0:  # Try to place a queen
-                if self.is_valid_move(row, col):
-                    self.board[row][col] = 1
-                    self.queens_left -= 1
-                    self.moves_count += 1
-                    self.move_paths.append(f"P({row}, {col})")
-                    return True
-            else:  # Remove the queen
-                self.board[row][col] = 0
-                self.queens_left += 1
-                self.moves_count += 1
-                self.move_paths.append(f"R({row}, {col})")
-                return True
-
-            return False
+    # Game model shared with game_logic, kept here as NQueensUI.NQueensGame
+    NQueensGame = NQueensGame
     
     def __init__(self, root, size, cell_size, offset):
         self.root = root
@@ -68,6 +33,15 @@ class NQueensUI:
         
         self.initialize_firebase()
 
+        # Worker threads for Firestore calls, polled from the Tk event loop
+        self.io = BackgroundIO(self.root)
+
+        # Completion search for the Hint menu, cached per position
+        self.hints = HintService()
+
+        # Precomputed catalogue of all solutions, if it has been built
+        self.catalogue = open_catalogue() if size == 16 else None
+
         # Create the menu bar
         self.create_menu_bar()
 
@@ -82,25 +56,13 @@ class NQueensUI:
         self.menu = tk.Menu(menu_bar, tearoff=0)
         self.menu.add_command(label="Start New Game", command=self.start_new_game)
         self.menu.add_command(label="Main Menu", command=self.back_to_start)
+        self.menu.add_command(label="Hint", command=self.show_hint)
         self.menu.add_command(label="Exit", command=self.root.quit)
         menu_bar.add_cascade(label="Menu", menu=self.menu)
 
         # Add the menu bar to the root window
         self.root.config(menu=menu_bar)
         
-    def create_chessboard(self, canvas, size, cell_size, offset):
-        color1 = "#954535"  # Brown color
-        color2 = "#F5DEB3"  # White color
-
-        for row in range(size):
-            for col in range(size):
-                color = color1 if (row + col) % 2 == 0 else color2
-                canvas.create_rectangle(
-                    col * cell_size + offset, row * cell_size + offset,
-                    (col + 1) * cell_size + offset, (row + 1) * cell_size + offset,
-                    fill=color, outline=color
-                )
-
     def add_labels(self, root, size, cell_size, offset):
         for i in range(size):
             row_label = tk.Label(root, text=str(size - i), font=('Times New Roman', 10))
@@ -134,12 +96,15 @@ class NQueensUI:
         if state == 'start':
             self.menu.entryconfig("Start New Game", state=tk.DISABLED)
             self.menu.entryconfig("Main Menu", state=tk.DISABLED)
+            self.menu.entryconfig("Hint", state=tk.DISABLED)
         elif state == 'game':
             self.menu.entryconfig("Start New Game", state=tk.DISABLED)
             self.menu.entryconfig("Main Menu", state=tk.DISABLED)
+            self.menu.entryconfig("Hint", state=tk.NORMAL)
         elif state == 'history':
             self.menu.entryconfig("Start New Game", state=tk.DISABLED)
             self.menu.entryconfig("Main Menu", state=tk.NORMAL)
+            self.menu.entryconfig("Hint", state=tk.DISABLED)
 
     def start_new_game(self):
         # Clear the existing game screen
@@ -153,7 +118,7 @@ class NQueensUI:
         self.canvas = tk.Canvas(self.root, width=self.size * self.cell_size + 2 * self.offset, height=self.size * self.cell_size + 2 * self.offset)
         self.canvas.pack()
 
-        self.create_chessboard(self.canvas, self.size, self.cell_size, self.offset)
+        self.renderer = BoardRenderer(self.canvas, self.size, self.cell_size, self.offset)
         self.add_labels(self.root, self.size, self.cell_size, self.offset)
 
         # Recreate labels with proper positioning
@@ -229,7 +194,7 @@ class NQueensUI:
         self.canvas = tk.Canvas(self.root, width=self.size * self.cell_size + 2 * self.offset, height=self.size * self.cell_size + 2 * self.offset)
         self.canvas.pack()
 
-        self.create_chessboard(self.canvas, self.size, self.cell_size, self.offset)
+        self.renderer = BoardRenderer(self.canvas, self.size, self.cell_size, self.offset)
         self.add_labels(self.root, self.size, self.cell_size, self.offset)
 
         # Recalculate center x-coordinate for proper placement of labels
@@ -267,7 +232,7 @@ class NQueensUI:
 
         if 0 <= x < self.size and 0 <= y < self.size:
             action = self.game.place_or_remove_queen(y, x)
-            self.update_board()
+            self.update_board([(y, x)])
 
             # Clear previous messages
             self.invalid_move_label.config(text="")
@@ -280,33 +245,23 @@ class NQueensUI:
                     self.queens_left_label.config(text=f"♛ left: {self.game.queens_left}")
 
                     if self.game.queens_left == 0:
-                        try:
-                            if self.is_move_paths_taken(self.game.move_paths):
-                                raise ValueError("The answer has already been taken! Try again.")
-                            else:
-                                end_time = time.time()
-                                game_time = round(end_time - self.start_time, 2)
-                                self.final_move_label.config(text=f"Congratulations {self.username.get()}! You have placed all  queens correctly. Time taken: {game_time} seconds.")
-                                self.board_locked = True  # Lock the board
-
-                                # Save the game record to Firebase
-                                try:
-                                    self.db.collection("nqueens").add({
-                                        "username": self.username.get(),
-                                        "moves_count": self.game.moves_count,
-                                        "game_time": game_time,
-                                        "move_paths": self.game.move_paths
-                                    })
-                                except Exception as e:
-                                    print(f"Error saving to Firebase: {e}")
-                                    self.final_move_label.config(text=f"Game completed, but could not save record: {e}")
-
-                                # Check and reset solutions if all have been found
-                                # self.check_and_reset_solutions()
-
-                        except ValueError as e:
-                            self.final_move_label_taken.config(text=str(e))
-                            self.board_locked = True  # Lock the board
+                        game_time = round(time.time() - self.start_time, 2)
+                        self.board_locked = True  # Lock the board while the answer is checked
+                        self.final_move_label.config(text="Checking your answer...")
+
+                        record = {
+                            "username": self.username.get(),
+                            "moves_count": self.game.moves_count,
+                            "game_time": game_time,
+                            "move_paths": self.game.move_paths,
+                            "board_key": self.game.board_key()
+                        }
+                        # The duplicate check and the save run off the Tk event loop
+                        self.io.submit(
+                            self.claim_solution, self.current_solution(), record,
+                            on_done=lambda result: self.on_claim_done(result, game_time),
+                            on_error=self.on_claim_error,
+                        )
 
                 else:
                     # Invalid move
@@ -326,33 +281,82 @@ class NQueensUI:
         self.master.destroy()  
 
 
-    def is_move_paths_taken(self, current_move_paths):
-        records = self.db.collection("nqueens").get()
-        current_set = set(current_move_paths)
+    def claim_solution(self, solution, record):
+        # Runs on a background thread: check the board and save the record.
+        # Returns "taken", "saved" or the error message if saving failed.
+        if self.is_board_taken(record["board_key"], solution):
+            return "taken"
 
-        for record in records:
-            data = record.to_dict()
-            existing_move_paths = data['move_paths']
-            existing_set = set(existing_move_paths)
-
-            if current_set == existing_set:
-                return True
-
-        return False                
+        # Mark the solution as found in the catalogue. The board key stays in
+        # the record for clients without a catalogue, which look it up.
+        if self.catalogue is not None:
+            record["solution_rank"] = rank_solution(solution, self.catalogue)
+            self.catalogue.mark_found(record["solution_rank"])
+            self.catalogue.flush()
 
-    def update_board(self):
-        self.canvas.delete("all")  # Clear previous board
-        for i in range(self.size):
-            for j in range(self.size):
-                x1 = j * self.cell_size + self.offset
-                y1 = i * self.cell_size + self.offset
-                x2 = x1 + self.cell_size
-                y2 = y1 + self.cell_size
-
-                if self.game.board[i][j] == 1:
-                    self.canvas.create_text((x1 + x2) // 2, (y1 + y2) // 2, text="♛", font=("Arial", 28), tags="queen")
-                else:
-                    self.canvas.create_rectangle(x1, y1, x2, y2, fill="#954535" if (i + j) % 2 == 0 else "#F5DEB3", outline="") 
+        # Save the game record to Firebase
+        try:
+            self.db.collection("nqueens").add(record)
+        except Exception as e:
+            print(f"Error saving to Firebase: {e}")
+            return str(e)
+        return "saved"
+
+    def on_claim_done(self, result, game_time):
+        self.final_move_label.config(text="")
+        if result == "taken":
+            self.final_move_label_taken.config(text="The answer has already been taken! Try again.")
+        elif result == "saved":
+            self.final_move_label.config(text=f"Congratulations {self.username.get()}! You have placed all  queens correctly. Time taken: {game_time} seconds.")
+
+            # Check and reset solutions if all have been found
+            # self.check_and_reset_solutions()
+        else:
+            self.final_move_label.config(text=f"Game completed, but could not save record: {result}")
+
+    def show_hint(self):
+        if self.board_locked or self.game.queens_left == 0:
+            return
+        self.invalid_move_label.config(text="")
+        self.final_move_label.config(text="Looking for a hint...")
+        # The search runs on a worker thread with a copy of the board
+        board = [row[:] for row in self.game.board]
+        self.io.submit(self.hints.hint, board, on_done=self.on_hint_done, on_error=self.on_claim_error)
+
+    def on_hint_done(self, result):
+        self.final_move_label.config(text="")
+        if result["status"] == SOLVABLE:
+            row, col = result["square"]
+            self.final_move_label.config(text=f"Hint: try a queen in row {self.size - row}, column {col + 1}.")
+        elif result["status"] == UNSOLVABLE:
+            self.invalid_move_label.config(text="This board cannot be completed, try moving a queen.")
+        else:
+            self.invalid_move_label.config(text="No hint found in time, please try again.")
+
+    def on_claim_error(self, error):
+        print(f"An error occurred: {error}")
+        self.final_move_label.config(text="")
+        self.board_locked = False  # Let the player try again
+        self.invalid_move_label.config(text="An unexpected error occurred. Please try again.")
+
+    def current_solution(self):
+        # Column of the queen in each row of the current board
+        return list(self.game.columns)
+
+    def is_board_taken(self, board_key, solution):
+        if self.catalogue is not None:
+            # Binary search plus a bit test instead of a collection scan
+            index = self.catalogue.index(solution)
+            return index is None or self.catalogue.is_found(index)
+
+        # Single indexed lookup on the board key, which does not depend on
+        # the order the queens were placed in
+        records = self.db.collection("nqueens").where("board_key", "==", board_key).limit(1).get()
+        return len(records) > 0
+
+    def update_board(self, cells=None):
+        # Only the cells that changed are redrawn, batched in one idle callback
+        self.renderer.update(self.game.board, cells)
 
     def clear_game_screen(self):
         if hasattr(self, 'canvas') and self.canvas:
@@ -4,7 +4,17 @@ import uuid
 import firebase_admin
 from firebase_admin import credentials, firestore
 import random
+from itertools import islice
 from tkinter import ttk
+from hanoi_solver import HanoiSolver
+from hanoi_engine import HanoiEngine, RODS
+from frame_stewart import FrameStewartSolver, optimal_moves
+from hanoi_codec import pack_moves
+
+
+AUTO_SOLVE_FRAME_MS = 16  # Time between auto-solve frames (about 60 per second)
+AUTO_SOLVE_MAX_BATCH = 100_000  # Most moves applied in one frame, keeps frames short
+MAX_STRING_MOVES = 1000  # Longer games are only saved as packed move_data
 
 
 class TowerOfHanoi:
@@ -19,17 +29,49 @@ class TowerOfHanoi:
         self.name = tk.StringVar()
         self.num_disks = tk.StringVar()
         self.num_disks_int = tk.IntVar()
-        self.num_moves = 0
-        self.move_sequence = []
+        self.num_rods = tk.IntVar(value=3)
+        self.engine = HanoiEngine()  # Rods, moves and win check; this class only draws them
         self.start_time = None
 
         self.frames = {}
         self.current_frame = None
         self.drag_data = None  # Initialize drag_data here
 
+        # Auto-solve state, see toggle_auto_solve()
+        self.auto_solving = False
+        self.auto_moves = None
+        self.auto_budget = 0.0
+        self.assisted = False  # Set once auto-solve has made moves in this game
+        self.auto_speed = tk.DoubleVar(value=1.0)  # log10 of moves per second
+
         self.initialize_firebase()  # Add this line to initialize Firebase
         self.create_frames()
         self.show_frame("NameEntry")
+
+    # Game state lives in the engine; these properties keep the old attributes
+    @property
+    def rods(self):
+        return self.engine.rods
+
+    @rods.setter
+    def rods(self, rods):
+        self.engine.rods = rods
+
+    @property
+    def num_moves(self):
+        return self.engine.num_moves
+
+    @num_moves.setter
+    def num_moves(self, num_moves):
+        self.engine.num_moves = num_moves
+
+    @property
+    def move_sequence(self):
+        return self.engine.move_sequence
+
+    @move_sequence.setter
+    def move_sequence(self, move_sequence):
+        self.engine.move_sequence = move_sequence
         
     def initialize_firebase(self):
         # Use your own Firebase credentials
@@ -116,6 +158,22 @@ class TowerOfHanoi:
         )
         self.disk_entry.pack(pady=10)
 
+        tk.Label(
+            frame,
+            text="Number of Rods:",
+            font=("Arial", 14),
+            bg="#ffffff",
+        ).pack(pady=5)
+        tk.Spinbox(
+            frame,
+            from_=3,
+            to=len(RODS),
+            textvariable=self.num_rods,
+            state="readonly",
+            width=5,
+            font=("Arial", 14),
+        ).pack(pady=5)
+
         self.disk_error_label = tk.Label(frame, text="", fg="red", font=("Arial", 12))
         self.disk_error_label.pack(pady=5)
 
@@ -169,14 +227,14 @@ class TowerOfHanoi:
         game_menu.add_command(label="Exit", command=self.go_back_to_main_menu)
 
         # Instructions and Error Labels
-        self.instructions_label = tk.Label(
+        self.goal_label = tk.Label(
             frame,
             text=" ----- Move all disks from rod A to rod C -----",
             font=("Arial", 15),
             bg="#ffffff",
             fg="blue",
         )
-        self.instructions_label.pack(pady=5)
+        self.goal_label.pack(pady=5)
         self.instructions_label = tk.Label(
             frame,
             text="----- Move only one disk at a time -----",
@@ -193,6 +251,31 @@ class TowerOfHanoi:
         self.canvas = tk.Canvas(frame, width=600, height=300, bg="#eee0d3")
         self.canvas.pack(pady=20)
 
+        # Auto-solve controls: start/stop and speed from 1 to 100,000 moves per second
+        controls = tk.Frame(frame, bg="#ffffff")
+        controls.pack()
+        self.auto_solve_button = tk.Button(
+            controls,
+            text="Auto Solve",
+            command=self.toggle_auto_solve,
+            font=("Arial", 10, "bold"),
+            bg="#f86b53",
+            fg="white",
+            activebackground="#e74755",
+            activeforeground="white",
+        )
+        self.auto_solve_button.pack(side="left", padx=10)
+        tk.Scale(
+            controls,
+            variable=self.auto_speed,
+            from_=0,
+            to=5,
+            resolution=0.5,
+            orient="horizontal",
+            label="Speed (10^x moves/s)",
+            bg="#ffffff",
+        ).pack(side="left")
+
         # Result label
         self.result_label = tk.Label(frame, text="", font=("Arial", 12))
         self.result_label.pack(pady=10)
@@ -234,16 +317,31 @@ class TowerOfHanoi:
         self.back_to_main_menu_button.pack(pady=20)
 
         # Initialize rods
-        self.rods = {"A": [], "B": [], "C": []}
-        self.rod_positions = {"A": 100, "B": 300, "C": 500}
-        self.disks = []
+        self.rod_positions = {}
+        self.disk_height = 20  # Scaled down in start_game() for many disks
+        self.disk_unit = 10  # Half-width added per disk size
+        self.disks = {}  # Canvas item -> (rod, disk)
+        self.disk_items = {}  # Disk -> canvas item
+
+        # Bind the drag handlers once on the "disk" tag; they also apply to
+        # disks drawn later
+        self.canvas.tag_bind("disk", "<ButtonPress-1>", self.on_disk_press)
+        self.canvas.tag_bind("disk", "<B1-Motion>", self.on_disk_drag)
+        self.canvas.tag_bind("disk", "<ButtonRelease-1>", self.on_disk_release)
+
+        self.draw_rods(3)
+
+    def draw_rods(self, num_rods):
+        # Spread the rods evenly over the canvas (A, B, C at 100, 300, 500)
+        self.canvas.delete("rod")
+        spacing = 600 // num_rods
+        self.rod_positions = {rod: spacing // 2 + i * spacing for i, rod in enumerate(RODS[:num_rods])}
 
         # Draw the rods and their labels
         rod_height = 200
         rod_width = 10
-        rod_labels = ["A", "B", "C"]  # Labels for the rods
 
-        for idx, (rod_name, x) in enumerate(self.rod_positions.items()):
+        for rod_name, x in self.rod_positions.items():
             # Draw the rod
             self.canvas.create_rectangle(
                 x - rod_width // 2,
@@ -251,6 +349,7 @@ class TowerOfHanoi:
                 x + rod_width // 2,
                 100 + rod_height,
                 fill="black",
+                tags="rod",
             )
 
             # Add the label
@@ -259,9 +358,10 @@ class TowerOfHanoi:
             self.canvas.create_text(
                 label_x,
                 label_y,
-                text=rod_labels[idx],
+                text=rod_name,
                 font=("Arial", 14, "bold"),
                 fill="red",
+                tags="rod",
             )
 
     def validate_disk_entry(self, num_disks):
@@ -320,15 +420,20 @@ class TowerOfHanoi:
         # Clear any error messages
         self.disk_error_label.config(text="")
         self.start_time = time.time()
-        self.num_moves = 0
-        self.move_sequence = []
-        self.rods = {"A": [], "B": [], "C": []}
-        self.disks = []
+        self.stop_auto_solve()
+        self.assisted = False
+        num_rods = self.num_rods.get()
+        self.engine = HanoiEngine(num_disks, num_rods)  # All disks on rod A, no moves yet
+        self.draw_rods(num_rods)
+        self.goal_label.config(text=f" ----- Move all disks from rod A to rod {RODS[num_rods - 1]} -----")
+
+        # Shrink the disks so large games still fit on the rods
+        self.disk_height = max(1, min(20, 200 // num_disks))
+        self.disk_unit = max(1, min(10, (300 // num_rods) // num_disks))
 
         # Initialize disks with colors
         self.disk_colors = {}
         for i in range(num_disks, 0, -1):
-            self.rods["A"].append(i)
             self.disk_colors[i] = self.generate_color_for_disk(i, num_disks)
 
         self.draw_disks()
@@ -337,40 +442,144 @@ class TowerOfHanoi:
         self.show_frame("Game")
 
     def draw_disks(self):
+        # Draw every disk from scratch, only needed when a game starts
         self.canvas.delete("disk")  # Only delete disks, not rods
         self.disks.clear()
+        self.disk_items.clear()
 
         for rod, disks in self.rods.items():
-            x = self.rod_positions[rod]
             for i, disk in enumerate(disks):
-                y = 300 - ((i + 1) * 20)  # Adjusted to match rod height
                 color = self.disk_colors[disk]  # Use stored color
                 outline_color = (
                     "yellow" if i == len(disks) - 1 else "black"
                 )  # Highlight top disk with yellow outline
                 rect = self.canvas.create_rectangle(
-                    x - disk * 10,
-                    y,
-                    x + disk * 10,
-                    y + 20,
+                    *self.disk_coords(disk, rod, i),
                     fill=color,
                     outline=outline_color,
                     tags="disk",
                 )
-                self.disks.append((rect, rod, disk))
-                if i == len(disks) - 1:  # Only bind events to the top disk
-                    self.canvas.tag_bind(rect, "<ButtonPress-1>", self.on_disk_press)
-                    self.canvas.tag_bind(rect, "<B1-Motion>", self.on_disk_drag)
-                    self.canvas.tag_bind(
-                        rect, "<ButtonRelease-1>", self.on_disk_release
-                    )
+                self.disks[rect] = (rod, disk)
+                self.disk_items[disk] = rect
+
+    def disk_coords(self, disk, rod, level):
+        # Rectangle of a disk at the given level (0 = bottom) of a rod
+        x = self.rod_positions[rod]
+        y = 300 - (level + 1) * self.disk_height
+        return x - disk * self.disk_unit, y, x + disk * self.disk_unit, y + self.disk_height
+
+    def move_disk(self, item, from_rod, to_rod):
+        # Redraw after the engine made a move: only the moved rectangle
+        # changes place, and the top-disk highlight moves on both rods
+        disk = self.disks[item][1]
+        self.disks[item] = (to_rod, disk)
+        self.canvas.coords(item, *self.disk_coords(disk, to_rod, self.engine.rod_height(to_rod) - 1))
+        self.canvas.itemconfigure(item, outline="yellow")
+        below = self.engine.disk_below(disk)
+        if below is not None:
+            self.canvas.itemconfigure(self.disk_items[below], outline="black")
+        top = self.engine.top_disk(from_rod)
+        if top is not None:
+            self.canvas.itemconfigure(self.disk_items[top], outline="yellow")
+
+    def toggle_auto_solve(self):
+        if self.auto_solving:
+            self.stop_auto_solve()
+            return
+        if self.engine.num_rods == 3:
+            solver = HanoiSolver(self.engine.num_disks)
+            step = solver.progress(self.rods)
+        else:
+            solver = FrameStewartSolver(self.engine.num_disks, self.engine.num_rods)
+            step = 0 if self.num_moves == 0 else None
+        if step is None:
+            # Off the optimal path: start again from the first move
+            self.engine.reset()
+            self.draw_disks()
+            step = 0
+        if self.engine.num_rods == 3:
+            self.auto_moves = solver.gray_moves(start=step)
+        else:
+            self.auto_moves = solver.moves()
+        self.auto_budget = 0.0
+        self.auto_solving = True
+        # Auto moves are not recorded in move_sequence, so a game finished
+        # by hand after this is not saved as a player result
+        self.assisted = True
+        self.drag_data = None
+        self.error_label.config(text="")
+        self.auto_solve_button.config(text="Stop")
+        self.last_frame_time = time.perf_counter()
+        self.master.after(AUTO_SOLVE_FRAME_MS, self.auto_solve_frame)
+
+    def stop_auto_solve(self):
+        self.auto_solving = False
+        self.auto_moves = None
+        if hasattr(self, "auto_solve_button"):
+            self.auto_solve_button.config(text="Auto Solve")
+
+    def auto_solve_frame(self):
+        # One animation frame: play every move that is due at the chosen
+        # speed, then redraw the result once. When frames come late (or the
+        # speed is above the frame rate) the moves pile up into one frame
+        # instead of one redraw per move.
+        if not self.auto_solving:
+            return
+        now = time.perf_counter()
+        self.auto_budget += (10 ** self.auto_speed.get()) * (now - self.last_frame_time)
+        self.last_frame_time = now
+        batch = min(int(self.auto_budget), AUTO_SOLVE_MAX_BATCH)
+        self.auto_budget -= batch
+
+        if batch:
+            before = list(self.engine.masks)
+            self.engine.play(islice(self.auto_moves, batch), record=False)
+            self.redraw_moved_disks(before)
+
+        if self.engine.is_solved():
+            self.stop_auto_solve()
+            self.result_label.config(text=f"Solved automatically in {self.num_moves} moves.")
+            self.start_new_game_button.pack(pady=10)
+            self.back_to_main_menu_button.pack(pady=10)
+        else:
+            self.master.after(AUTO_SOLVE_FRAME_MS, self.auto_solve_frame)
+
+    def redraw_moved_disks(self, before):
+        # Reposition the disks whose rod changed since before (the engine
+        # masks), and the smaller disks whose level may have changed with
+        # them. Only the old and new top disks change their highlight.
+        changed = 0
+        for old, new in zip(before, self.engine.masks):
+            changed |= old ^ new
+        for disk in range(1, changed.bit_length() + 1):
+            rod, level = self.engine.disk_position(disk)
+            item = self.disk_items[disk]
+            self.disks[item] = (rod, disk)
+            self.canvas.coords(item, *self.disk_coords(disk, rod, level))
+
+        tops = {self.engine.top_disk(rod) for rod in self.rod_positions} - {None}
+        for mask in before:
+            old_top = (mask & -mask).bit_length()
+            if old_top and old_top not in tops:
+                self.canvas.itemconfigure(self.disk_items[old_top], outline="black")
+        for disk in tops:
+            self.canvas.itemconfigure(self.disk_items[disk], outline="yellow")
 
     def on_disk_press(self, event):
+        if self.auto_solving:
+            return  # The disks are moved by auto-solve
         item = self.canvas.find_closest(event.x, event.y)[0]
 
         # Find the disk and rod associated with the item
-        disk_index = next(i for i, d in enumerate(self.disks) if d[0] == item)
-        rod = self.disks[disk_index][1]
+        if item not in self.disks:
+            return
+        rod, disk_size = self.disks[item]
+
+        # Check if the disk is the topmost disk on its rod
+        if self.engine.top_disk(rod) != disk_size:
+            self.drag_data = None
+            self.error_label.config(text="Error: You can only move the top disk.")
+            return
 
         # Initialize drag_data
         self.drag_data = {
@@ -379,11 +588,6 @@ class TowerOfHanoi:
             "y": event.y,
         }
 
-        # Check if the disk is the topmost disk on its rod
-        if self.rods[rod][-1] != self.disks[disk_index][2]:
-            self.error_label.config(text="Error: You can only move the top disk.")
-            return
-
         # Clear the error message if the user selects the correct disk
         self.error_label.config(text="")
 
@@ -412,23 +616,16 @@ class TowerOfHanoi:
             rod = self.get_rod(x)
 
             # Identify the disk being moved
-            disk_index = next(i for i, d in enumerate(self.disks) if d[0] == item)
-            current_rod = self.disks[disk_index][1]
-            disk_size = self.disks[disk_index][2]
+            current_rod, disk_size = self.disks[item]
 
             # Validate the rod
             if rod is None or rod == current_rod:
                 self.reset_disk(item)
                 return
 
-            # Check if the move is valid (placing the disk on an empty rod or on a larger disk)
-            if not self.rods[rod] or self.rods[rod][-1] > disk_size:
-                self.rods[current_rod].pop()
-                self.rods[rod].append(disk_size)
-                self.disks[disk_index] = (item, rod, disk_size)
-                self.move_sequence.append((current_rod, rod))
-                self.num_moves += 1
-                self.draw_disks()
+            # The engine only makes valid moves (onto an empty rod or a larger disk)
+            if self.engine.move(current_rod, rod):
+                self.move_disk(item, current_rod, rod)
                 self.check_win()
                 self.error_label.config(text="")  # Clear any previous error messages
             else:
@@ -449,34 +646,50 @@ class TowerOfHanoi:
         if item is None:
             return  # Do nothing if item is None
 
-        disk_index = next(i for i, d in enumerate(self.disks) if d[0] == item)
-        rod = self.disks[disk_index][1]
-        disk_size = self.disks[disk_index][2]
-        x = self.rod_positions[rod]
-        y = 300 - (len(self.rods[rod]) * 20)
-        self.canvas.coords(item, x - disk_size * 10, y, x + disk_size * 10, y + 20)
+        rod, disk_size = self.disks[item]
+        self.canvas.coords(item, *self.disk_coords(disk_size, rod, self.engine.rod_height(rod) - 1))
 
     def get_rod(self, x):
+        reach = min(50, 300 // len(self.rod_positions))  # Half the gap between rods at most
         for rod, pos in self.rod_positions.items():
-            if abs(x - pos) < 50:
+            if abs(x - pos) < reach:
                 return rod
         return None
 
     def check_win(self):
-        if len(self.rods["C"]) == self.num_disks_int.get():
+        num_rods = self.engine.num_rods
+        optimal = optimal_moves(self.num_disks_int.get(), num_rods)  # Frame-Stewart for 4+ rods
+        if self.engine.is_solved() and self.assisted:
+            self.result_label.config(text=f"Solved in {self.num_moves} moves with help from auto-solve, "
+                                          "so the result is not saved.")
+            self.start_new_game_button.pack(pady=10)
+            self.back_to_main_menu_button.pack(pady=10)
+        elif self.engine.is_solved():
             end_time = time.time()
             elapsed_time = end_time - self.start_time
             player_name = self.name.get()  # Get the player name from the entry field
             self.result_label.config(
                 text=f"{player_name}, you've solved the puzzle in {self.num_moves} moves and {elapsed_time:.2f} seconds!"
+                f" (optimal: {optimal} moves)"
             )
             self.save_game_result()  # Update method name
             self.start_new_game_button.pack(pady=10)
             self.back_to_main_menu_button.pack(pady=10)
+        elif num_rods == 3:
+            # Grade the position against the optimal solution without replaying it
+            step = HanoiSolver(self.num_disks_int.get()).progress(self.rods)
+            if step is None:
+                self.result_label.config(text="You have left the optimal path.")
+            else:
+                self.result_label.config(text=f"Optimal path: {step} of {optimal} moves done.")
+        else:
+            # With more rods there are many optimal paths, so only the target is shown
+            self.result_label.config(text=f"Moves: {self.num_moves} (fewest possible with {num_rods} rods: {optimal})")
             
 #--------------------------------------------------Game Logic------------------------------------------------------------------------
 
     def start_new_game(self):
+        self.stop_auto_solve()
         self.result_label.config(text="")
         self.error_label.config(text="")
         self.disk_error_label.config(text="")
@@ -496,16 +709,20 @@ class TowerOfHanoi:
         time_taken = round(time.time() - self.start_time, 2)
         game_id = str(uuid.uuid4())  # Generate a unique ID for the game session
 
-        move_sequence_str = ",".join(["".join(move) for move in self.move_sequence])
-
         game_data = {
             "game_id": game_id,
             "player_name": player_name,  # Store player name for querying
             "num_disks": num_disks,
+            "num_rods": self.engine.num_rods,
             "moves": moves,
             "time_taken": time_taken,
-            "move_sequence": move_sequence_str,  # Store the move sequence as a string
+            # Packed moves, a few bits each (see hanoi_codec), compressed for long games
+            "move_data": pack_moves(self.move_sequence, self.engine.num_rods,
+                                    compress=len(self.move_sequence) > MAX_STRING_MOVES),
         }
+        if len(self.move_sequence) <= MAX_STRING_MOVES:
+            # Readable copy such as "AC,AB,CB" for the results table
+            game_data["move_sequence"] = ",".join(["".join(move) for move in self.move_sequence])
 
         # Save the game result to Firebase with a unique document ID
         self.db.collection("TowerofHanoi").document(game_id).set(game_data)
@@ -595,7 +812,7 @@ class TowerOfHanoi:
                     result['player_name'],
                     result['num_disks'],
                     result['moves'],
-                    result['move_sequence'],
+                    result.get('move_sequence', f"({result['moves']} moves, packed)"),
                     result['time_taken']
                 ))
         else:
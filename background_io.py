@@ -0,0 +1,64 @@
+import queue
+from concurrent.futures import ThreadPoolExecutor
+
+
+class BackgroundIO:
+    """Runs slow calls (Firestore reads and writes) on worker threads.
+
+    Results are put on a queue that is polled from the Tk event loop with
+    after(), so the callbacks run on the Tk thread and the UI never waits
+    for the network.
+    """
+
+    def __init__(self, root, max_workers=2, poll_interval=50):
+        self.root = root
+        self.poll_interval = poll_interval  # Milliseconds between queue checks
+        self.executor = ThreadPoolExecutor(max_workers=max_workers)
+        self.results = queue.Queue()
+        self.pending = 0
+        self.polling = False
+
+    def submit(self, func, *args, on_done=None, on_error=None):
+        # Run func(*args) in the background; on_done(result) or on_error(exception)
+        # is called on the Tk thread once it finishes
+        self.pending += 1
+        future = self.executor.submit(func, *args)
+        future.add_done_callback(lambda f: self.results.put((f, on_done, on_error)))
+        if not self.polling:
+            self.polling = True
+            self.root.after(self.poll_interval, self.poll)
+        return future
+
+    def poll(self):
+        try:
+            while True:
+                try:
+                    future, on_done, on_error = self.results.get_nowait()
+                except queue.Empty:
+                    break
+                self.pending -= 1
+                self.deliver(future, on_done, on_error)
+        finally:
+            # Keep polling only while there is work in flight
+            if self.pending:
+                self.root.after(self.poll_interval, self.poll)
+            else:
+                self.polling = False
+
+    def deliver(self, future, on_done, on_error):
+        # Call the callback for one finished task. A failing callback is
+        # reported and must not stop the results of later tasks.
+        try:
+            error = future.exception()
+            if error is not None:
+                if on_error:
+                    on_error(error)
+                else:
+                    print(f"Background task failed: {error}")
+            elif on_done:
+                on_done(future.result())
+        except Exception as e:
+            print(f"Background task callback failed: {e!r}")
+
+    def shutdown(self):
+        self.executor.shutdown(wait=False)
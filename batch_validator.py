@@ -0,0 +1,41 @@
+import numpy as np
+
+# Vectorized validation of many N-Queens boards at once. Each board is a
+# row of column placements (board[row] = column of the queen in that row),
+# so an (m x n) array holds m boards of size n.
+
+DEFAULT_CHUNK_SIZE = 1 << 18  # Boards checked per chunk, bounds the temporary arrays
+
+
+# True for each row of values that has no repeated entry
+def _all_distinct(values):
+    ordered = np.sort(values, axis=1)
+    return (ordered[:, 1:] != ordered[:, :-1]).all(axis=1)
+
+# Check all boards for column and diagonal conflicts.
+# Returns a boolean mask with True for every valid board.
+def validate_boards(placements, chunk_size=DEFAULT_CHUNK_SIZE):
+    boards = np.asarray(placements)
+    if boards.ndim != 2:
+        raise ValueError(f"Expected an (m x n) array of placements, got shape {boards.shape}")
+    if not np.issubdtype(boards.dtype, np.integer):
+        raise ValueError(f"Placements must be integers, got {boards.dtype}")
+
+    m, n = boards.shape
+    rows = np.arange(n, dtype=np.int64)
+    valid = np.empty(m, dtype=bool)
+    for start in range(0, m, chunk_size):
+        chunk = boards[start:start + chunk_size].astype(np.int64)
+        in_range = ((chunk >= 0) & (chunk < n)).all(axis=1)
+        valid[start:start + chunk_size] = (
+            in_range
+            & _all_distinct(chunk)  # Columns
+            & _all_distinct(chunk + rows)  # Anti-diagonals
+            & _all_distinct(chunk - rows)  # Diagonals
+        )
+    return valid
+
+# Build the placements array from packed solutions (see pack_solution)
+def boards_from_packed(packed_solutions, n):
+    data = b"".join(packed_solutions)
+    return np.frombuffer(data, dtype=np.uint8).reshape(-1, n)
@@ -26,3 +26,54 @@ def add_labels(root, size, cell_size, offset):
 
         col_label_mirror = tk.Label(root, text=str(i + 1), font=('Times New Roman', 10))
         col_label_mirror.place(x=i * cell_size + offset + cell_size // 3, y=size * cell_size + offset + offset // 4)
+
+
+class BoardRenderer:
+    """Draws the board items once and then only touches cells that change."""
+
+    def __init__(self, canvas, size, cell_size, offset):
+        self.canvas = canvas
+        self.size = size
+        self.shown = [[0] * size for _ in range(size)]  # Board state currently on screen
+        self.queens = {}  # (row, col) -> canvas text item of the queen
+        self.board = None
+        self.dirty = set()
+        self.full_refresh = False
+        self.scheduled = False
+
+        create_chessboard(canvas, size, cell_size, offset)
+        for row in range(size):
+            for col in range(size):
+                x = col * cell_size + offset + cell_size // 2
+                y = row * cell_size + offset + cell_size // 2
+                self.queens[(row, col)] = canvas.create_text(
+                    x, y, text="♛", font=("Arial", 28), tags="queen", state="hidden"
+                )
+
+    def update(self, board, cells=None):
+        # Queue the changed cells (or the whole board when they are not known)
+        # and redraw them all in one idle callback
+        self.board = board
+        if cells is None:
+            self.full_refresh = True
+        else:
+            self.dirty.update(cells)
+        if not self.scheduled:
+            self.scheduled = True
+            self.canvas.after_idle(self.flush)
+
+    def flush(self):
+        self.scheduled = False
+        if self.board is None:
+            return
+        if self.full_refresh:
+            cells = [(row, col) for row in range(self.size) for col in range(self.size)]
+        else:
+            cells = self.dirty
+        for row, col in cells:
+            value = self.board[row][col]
+            if self.shown[row][col] != value:
+                self.shown[row][col] = value
+                self.canvas.itemconfigure(self.queens[(row, col)], state="normal" if value else "hidden")
+        self.dirty = set()
+        self.full_refresh = False
@@ -0,0 +1,67 @@
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from nqueens.core import generate_prefixes, solve_prefix, count_prefix
+
+# Resumable N-Queens search. The tree is split into first-row (or
+# first-two-row) prefix subtrees, and after each finished subtree a
+# checkpoint file records the finished prefixes and the count so far.
+# A restarted run skips the finished subtrees and carries on.
+
+
+# Read a checkpoint, or start a new one if the file does not exist
+def load_checkpoint(path, n, prefix_depth):
+    if not os.path.exists(path):
+        return {"n": n, "prefix_depth": prefix_depth, "completed": [], "count": 0}
+    with open(path) as file:
+        checkpoint = json.load(file)
+    if checkpoint["n"] != n or checkpoint["prefix_depth"] != prefix_depth:
+        raise ValueError(
+            f"Checkpoint {path} is for n={checkpoint['n']}, prefix_depth={checkpoint['prefix_depth']}"
+        )
+    return checkpoint
+
+# Write the checkpoint atomically, so a crash mid-write never loses it
+def save_checkpoint(path, checkpoint):
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w") as file:
+        json.dump(checkpoint, file)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(tmp_path, path)
+
+# Count (or collect) every n-Queens solution, resuming from checkpoint_path.
+# With on_solutions=None only the number of solutions is computed; otherwise
+# on_solutions(prefix, solutions) is called for each finished subtree before
+# it is checkpointed, e.g. to persist the solutions.
+def solve_with_checkpoints(n, checkpoint_path, prefix_depth=2, workers=None, on_solutions=None):
+    prefix_depth = min(prefix_depth, n)
+    checkpoint = load_checkpoint(checkpoint_path, n, prefix_depth)
+    completed = {tuple(prefix) for prefix in checkpoint["completed"]}
+    pending = [prefix for prefix in generate_prefixes(n, prefix_depth) if tuple(prefix) not in completed]
+
+    worker = count_prefix if on_solutions is None else solve_prefix
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(worker, n, prefix): prefix for prefix in pending}
+        for future in as_completed(futures):
+            prefix = futures[future]
+            result = future.result()
+            if on_solutions is None:
+                checkpoint["count"] += result
+            else:
+                on_solutions(prefix, result)
+                checkpoint["count"] += len(result)
+            checkpoint["completed"].append(prefix)
+            save_checkpoint(checkpoint_path, checkpoint)
+    return checkpoint["count"]
+
+
+if __name__ == "__main__":
+    # Usage: python checkpoint_n_queens.py n checkpoint.json
+    n = int(sys.argv[1])
+    path = sys.argv[2] if len(sys.argv) > 2 else f"nqueens{n}.checkpoint.json"
+    start_time = time.time()
+    count = solve_with_checkpoints(n, path)
+    print(f"n={n}: {count} solutions ({time.time() - start_time:.2f} seconds this run)")
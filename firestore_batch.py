@@ -0,0 +1,65 @@
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from itertools import islice
+
+# Firestore accepts at most 500 writes in one batch
+MAX_BATCH_SIZE = 500
+
+
+# Split an iterable of records into lists of at most size records
+def chunked(records, size):
+    records = iter(records)
+    while True:
+        chunk = list(islice(records, size))
+        if not chunk:
+            return
+        yield chunk
+
+# Write one chunk as a single batch, retrying with exponential backoff.
+# The document IDs are picked once, so a retry after a commit that reached
+# the server but reported an error overwrites the same documents instead of
+# writing the chunk twice.
+def commit_chunk(db, collection_name, chunk, max_retries=5, backoff=0.5):
+    collection_ref = db.collection(collection_name)
+    doc_refs = [collection_ref.document() for _ in chunk]
+    for attempt in range(max_retries + 1):
+        try:
+            batch = db.batch()
+            for doc_ref, record in zip(doc_refs, chunk):
+                batch.set(doc_ref, record)
+            batch.commit()
+            return len(chunk)
+        except Exception as e:
+            if attempt == max_retries:
+                raise
+            delay = backoff * (2 ** attempt)
+            print(f"Batch commit failed ({e}), retrying in {delay:.1f} seconds...")
+            time.sleep(delay)
+
+# Save records (an iterable of dicts, consumed lazily) to a collection in
+# write batches. At most max_workers batches are in flight at a time, and
+# progress(saved) is called after each committed batch.
+def save_in_batches(db, collection_name, records, batch_size=MAX_BATCH_SIZE,
+                    max_workers=4, max_retries=5, backoff=0.5, progress=None):
+    if not 0 < batch_size <= MAX_BATCH_SIZE:
+        raise ValueError(f"batch_size must be between 1 and {MAX_BATCH_SIZE}")
+
+    saved = 0
+    pending = set()
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        def collect(done):
+            nonlocal saved
+            for future in done:
+                saved += future.result()
+                if progress:
+                    progress(saved)
+
+        for chunk in chunked(records, batch_size):
+            # Wait for a free slot before building the next batch
+            if len(pending) >= max_workers:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                collect(done)
+            pending.add(executor.submit(commit_chunk, db, collection_name, chunk, max_retries, backoff))
+
+        collect(wait(pending).done)
+    return saved
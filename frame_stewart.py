@@ -0,0 +1,150 @@
+import json
+import os
+import sys
+import time
+from hanoi_engine import RODS
+from hanoi_solver import HanoiSolver
+
+# Tower of Hanoi with four or more rods, solved with the Frame-Stewart
+# algorithm: move the top t disks to a spare rod using all k rods, move the
+# other n - t disks to the target with the k - 1 rods left, then move the
+# t disks onto them with all k rods again. The best split t for every
+# (n, k) is kept in a table that is cached on disk, in the user's cache
+# directory so it never lands in the working directory.
+# Frame-Stewart is proven optimal for 3 and 4 rods and conjectured for more.
+
+# Where the table is cached: $XDG_CACHE_HOME (or ~/.cache)/tower_of_hanoi/
+CACHE_DIR = os.path.join(os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"),
+                         "tower_of_hanoi")
+DEFAULT_TABLE_PATH = os.path.join(CACHE_DIR, "frame_stewart_table.json")
+DEFAULT_MAX_DISKS = 64
+DEFAULT_MAX_RODS = len(RODS)
+
+
+class SplitTable:
+    """Fewest moves and best split for every n <= max_disks and 3 <= k <= max_rods."""
+
+    def __init__(self, max_disks, max_rods, moves=None, splits=None):
+        self.max_disks = max_disks
+        self.max_rods = max_rods
+        if moves is None:
+            moves, splits = self.build(max_disks, max_rods)
+        self.moves = moves  # moves[k][n], lists for k = 0 and 1 unused
+        self.splits = splits  # splits[k][n], the t to move aside first
+
+    @staticmethod
+    def build(max_disks, max_rods):
+        moves = [[] for _ in range(max_rods + 1)]
+        splits = [[] for _ in range(max_rods + 1)]
+        moves[3] = [(1 << n) - 1 for n in range(max_disks + 1)]
+        splits[3] = [max(n - 1, 0) for n in range(max_disks + 1)]
+        for k in range(4, max_rods + 1):
+            moves[k] = [0, 1]
+            splits[k] = [0, 0]
+            for n in range(2, max_disks + 1):
+                best, best_t = None, None
+                for t in range(1, n):
+                    cost = 2 * moves[k][t] + moves[k - 1][n - t]
+                    if best is None or cost < best:
+                        best, best_t = cost, t
+                moves[k].append(best)
+                splits[k].append(best_t)
+        return moves, splits
+
+    def covers(self, num_disks, num_rods):
+        return num_disks <= self.max_disks and 3 <= num_rods <= self.max_rods
+
+    def to_dict(self):
+        return {"max_disks": self.max_disks, "max_rods": self.max_rods,
+                "moves": self.moves, "splits": self.splits}
+
+
+# Read the table from path, or build it (and write it for the next run) if
+# the file is missing or too small. path=None uses table_path.
+def load_split_table(path=None, max_disks=DEFAULT_MAX_DISKS, max_rods=DEFAULT_MAX_RODS):
+    path = path or table_path
+    if os.path.exists(path):
+        try:
+            with open(path) as file:
+                data = json.load(file)
+            table = SplitTable(data["max_disks"], data["max_rods"], data["moves"], data["splits"])
+            if table.covers(max_disks, max_rods):
+                return table
+            max_disks, max_rods = max(max_disks, table.max_disks), max(max_rods, table.max_rods)
+        except (ValueError, KeyError) as e:
+            print(f"Ignoring unreadable split table {path}: {e}")
+
+    table = SplitTable(max_disks, max_rods)
+    # Write atomically, so a crash mid-write never leaves a broken table.
+    # The cache is only a shortcut: if it cannot be written, carry on.
+    tmp_path = path + ".tmp"
+    try:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(tmp_path, "w") as file:
+            json.dump(table.to_dict(), file)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        print(f"Could not cache split table in {path}: {e}")
+    return table
+
+
+table_path = DEFAULT_TABLE_PATH  # Cache file used by default, tests point it elsewhere
+_table = None
+
+# The table shared by all solvers, loaded once and grown when needed
+def get_split_table(num_disks=0, num_rods=3, path=None):
+    global _table
+    if _table is None or not _table.covers(num_disks, num_rods):
+        _table = load_split_table(path, max(num_disks, DEFAULT_MAX_DISKS), max(num_rods, DEFAULT_MAX_RODS))
+    return _table
+
+
+class FrameStewartSolver:
+
+    def __init__(self, num_disks, num_rods=4, table=None):
+        if not isinstance(num_disks, int) or num_disks < 0:
+            raise ValueError(f"Number of disks must be a whole number >= 0, got {num_disks!r}")
+        if not 3 <= num_rods <= len(RODS):
+            raise ValueError(f"Number of rods must be between 3 and {len(RODS)}, got {num_rods}")
+        self.num_disks = num_disks
+        self.num_rods = num_rods
+        self.rods = RODS[:num_rods]  # Disks go from the first rod to the last
+        self.table = table or get_split_table(num_disks, num_rods)
+
+    def move_count(self):
+        return self.table.moves[self.num_rods][self.num_disks]
+
+    def moves(self):
+        # Lazy generator of (from_rod, to_rod) moves
+        source, target, spares = self.rods[0], self.rods[-1], list(self.rods[1:-1])
+        return self._solve(self.num_disks, source, target, spares)
+
+    def _solve(self, n, source, target, spares):
+        if n == 0:
+            return
+        if len(spares) == 1:
+            yield from HanoiSolver(n, source, spares[0], target).iterative_moves()
+            return
+        t = self.table.splits[len(spares) + 2][n]
+        middle, others = spares[0], spares[1:]
+        yield from self._solve(t, source, middle, [target] + others)
+        yield from self._solve(n - t, source, target, others)
+        yield from self._solve(t, middle, target, [source] + others)
+
+
+# Fewest moves for num_disks disks on num_rods rods
+def optimal_moves(num_disks, num_rods=3):
+    if num_rods == 3:
+        return (1 << num_disks) - 1
+    return get_split_table(num_disks, num_rods).moves[num_rods][num_disks]
+
+
+if __name__ == "__main__":
+    # Usage: python frame_stewart.py [max_disks] -- build the table and print part of it
+    max_disks = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_MAX_DISKS
+    start_time = time.perf_counter()
+    table = load_split_table(max_disks=max_disks)
+    print(f"Table for up to {table.max_disks} disks and {table.max_rods} rods "
+          f"ready in {time.perf_counter() - start_time:.3f} seconds")
+    for k in range(3, table.max_rods + 1):
+        print(f"{k} rods: " + ", ".join(str(table.moves[k][n]) for n in range(1, 11)))
@@ -6,35 +6,68 @@ class NQueensGame:
         self.moves_count = 0
         self.move_paths = []  # Store the move paths as a list of strings
 
+        # Queen counts per row, column and diagonal, kept up to date on every
+        # move so a move can be validated in O(1)
+        self.row_counts = [0] * size
+        self.col_counts = [0] * size
+        self.diag_counts = [0] * (2 * size - 1)  # Indexed by row - col + size - 1
+        self.anti_diag_counts = [0] * (2 * size - 1)  # Indexed by row + col
+        self.columns = [-1] * size  # Column of the queen in each row, -1 if empty
+
+        # Squares where a queen could still be placed
+        self.safe_squares = {(row, col) for row in range(size) for col in range(size)}
+
     def is_valid_move(self, row, col):
-        # Check the row
-        for i in range(self.size):
-            if self.board[row][i] == 1:
-                return False
+        return (
+            self.row_counts[row] == 0
+            and self.col_counts[col] == 0
+            and self.diag_counts[row - col + self.size - 1] == 0
+            and self.anti_diag_counts[row + col] == 0
+        )
 
-        # Check the column
-        for i in range(self.size):
-            if self.board[i][col] == 1:
-                return False
+    def board_key(self):
+        # Fixed-width key of the final board: the queen's column in every row
+        # as hex digits, so the same board gives the same key whatever the
+        # order of the moves (empty rows show as dashes)
+        width = len(f"{self.size - 1:x}")
+        return "".join(f"{col:0{width}x}" if col >= 0 else "-" * width for col in self.columns)
 
-        # Check the diagonals
+    def attacked_squares(self, row, col):
+        # Squares on the same row, column and diagonals as (row, col)
         for i in range(self.size):
-            for j in range(self.size):
-                if abs(row - i) == abs(col - j) and self.board[i][j] == 1:
-                    return False
+            yield row, i
+            yield i, col
+            j = col + i - row
+            if 0 <= j < self.size:
+                yield i, j
+            j = col - i + row
+            if 0 <= j < self.size:
+                yield i, j
 
-        return True
+    def update_counts(self, row, col, delta):
+        self.row_counts[row] += delta
+        self.col_counts[col] += delta
+        self.diag_counts[row - col + self.size - 1] += delta
+        self.anti_diag_counts[row + col] += delta
 
     def place_or_remove_queen(self, row, col):
         if self.board[row][col] == 0:  # Try to place a queen
             if self.is_valid_move(row, col):
                 self.board[row][col] = 1
+                self.columns[row] = col
+                self.update_counts(row, col, 1)
+                self.safe_squares.difference_update(self.attacked_squares(row, col))
                 self.queens_left -= 1
                 self.moves_count += 1
                 self.move_paths.append(f"P({row}, {col})")
                 return True
         else:  # Remove the queen
             self.board[row][col] = 0
+            self.columns[row] = -1
+            self.update_counts(row, col, -1)
+            for square in self.attacked_squares(row, col):
+                if self.is_valid_move(*square):
+                    self.safe_squares.add(square)
             self.queens_left += 1
             self.moves_count += 1
             self.move_paths.append(f"R({row}, {col})")
@@ -0,0 +1,135 @@
+import hashlib
+from array import array
+from frame_stewart import optimal_moves
+from hanoi_codec import iter_moves
+from hanoi_engine import RODS, ROD_INDEX
+
+# Analysis of stored Tower of Hanoi games. save_game_result() stores the
+# moves as a comma-joined string such as "AC,AB,CB"; the analyser replays
+# it, checks every move and scores the game against the optimum (2^n - 1
+# moves on 3 rods, Frame-Stewart on more).
+
+
+class InvalidMoveError(ValueError):
+    def __init__(self, move_number, move, reason):
+        super().__init__(f"Move {move_number} ({move}): {reason}")
+        self.move_number = move_number
+        self.move = move
+
+
+# Split a stored move string into (from_rod, to_rod) pairs
+def parse_move_sequence(move_sequence):
+    if not move_sequence:
+        return []
+    moves = []
+    for move_number, move in enumerate(move_sequence.split(","), start=1):
+        if len(move) != 2 or move[0] not in ROD_INDEX or move[1] not in ROD_INDEX or move[0] == move[1]:
+            raise InvalidMoveError(move_number, move, "not a move between two different rods")
+        moves.append((move[0], move[1]))
+    return moves
+
+
+class RodState:
+    """Rods as compact arrays of disks (bottom to top), plus the rod of every disk."""
+
+    def __init__(self, num_disks, num_rods=3):
+        self.num_disks = num_disks
+        self.num_rods = num_rods
+        self.target = num_rods - 1
+        self.stacks = [array("H", range(num_disks, 0, -1))] + [array("H") for _ in range(num_rods - 1)]
+        self.position = bytearray(num_disks + 1)  # position[disk] = rod index, disk 0 unused
+
+    def move(self, move_number, from_rod, to_rod):
+        if ROD_INDEX[from_rod] >= self.num_rods or ROD_INDEX[to_rod] >= self.num_rods:
+            raise InvalidMoveError(move_number, from_rod + to_rod,
+                                   f"the game only has rods {RODS[0]}-{RODS[self.num_rods - 1]}")
+        source, target = self.stacks[ROD_INDEX[from_rod]], self.stacks[ROD_INDEX[to_rod]]
+        if not source:
+            raise InvalidMoveError(move_number, from_rod + to_rod, f"rod {from_rod} is empty")
+        disk = source[-1]
+        if target and target[-1] < disk:
+            raise InvalidMoveError(move_number, from_rod + to_rod, f"disk {disk} cannot go on disk {target[-1]}")
+        target.append(source.pop())
+        self.position[disk] = ROD_INDEX[to_rod]
+
+    def min_remaining_moves(self):
+        # Fewest moves from this position to all disks on the target rod.
+        # Going from the largest disk down: a disk already on the current
+        # target stays put; otherwise it needs one move, and the disks above
+        # it first have to be gathered on the third rod (2^(disk-1) - 1
+        # moves), which becomes the target for the smaller disks.
+        # Only known in closed form for 3 rods, None otherwise (unless solved).
+        if self.num_rods != 3:
+            return 0 if self.is_solved() else None
+        target = self.target
+        moves = 0
+        for disk in range(self.num_disks, 0, -1):
+            rod = self.position[disk]
+            if rod != target:
+                moves += 1 << (disk - 1)
+                target = 3 - rod - target
+        return moves
+
+    def is_solved(self):
+        return len(self.stacks[self.target]) == self.num_disks
+
+
+# Replay a stored game and score it. move_sequence is the stored string
+# or packed bytes (see hanoi_codec). wasted_moves is how many more moves
+# the player made (or still needs) than the optimum, None when unknown.
+def analyse_moves(num_disks, move_sequence, num_rods=3):
+    optimal = optimal_moves(num_disks, num_rods)
+    state = RodState(num_disks, num_rods)
+    played = 0
+    try:
+        if isinstance(move_sequence, bytes):
+            moves = iter_moves(move_sequence)
+        else:
+            moves = parse_move_sequence(move_sequence)
+        for played, (from_rod, to_rod) in enumerate(moves, start=1):
+            state.move(played, from_rod, to_rod)
+    except InvalidMoveError as e:
+        return {"valid": False, "error": str(e), "moves": e.move_number - 1, "solved": False,
+                "optimal_moves": optimal, "remaining_moves": None, "wasted_moves": None}
+    except ValueError as e:  # Damaged packed data
+        return {"valid": False, "error": str(e), "moves": played, "solved": False,
+                "optimal_moves": optimal, "remaining_moves": None, "wasted_moves": None}
+
+    remaining = state.min_remaining_moves()
+    return {"valid": True, "error": None, "moves": played, "solved": state.is_solved(),
+            "optimal_moves": optimal, "remaining_moves": remaining,
+            "wasted_moves": None if remaining is None else played + remaining - optimal}
+
+# Analyse one record saved by TowerOfHanoi.save_game_result(). Long games
+# only have the packed move_data. results is an optional dict of earlier
+# results keyed by a digest of the moves, so identical games are replayed
+# once without keeping their (possibly multi-MB) move data as keys.
+def analyse_game(game_data, results=None):
+    moves = game_data.get("move_sequence")
+    if moves is None:
+        moves = bytes(game_data["move_data"])
+    num_disks, num_rods = game_data["num_disks"], game_data.get("num_rods", 3)
+    key = (num_disks, num_rods, hashlib.sha256(moves if isinstance(moves, bytes) else moves.encode()).digest())
+    if results is not None and key in results:
+        result = results[key]
+    else:
+        result = analyse_moves(num_disks, moves, num_rods)
+        if results is not None:
+            results[key] = result
+    result = dict(result)
+    result["game_id"] = game_data.get("game_id")
+    result["player_name"] = game_data.get("player_name")
+    result["time_taken"] = game_data.get("time_taken")
+    return result
+
+# Analyse many records. Identical games (most often the optimal solution)
+# are only replayed once per call.
+def analyse_games(records):
+    results = {}
+    return [analyse_game(game_data, results) for game_data in records]
+
+# Best solved games: fewest wasted moves first, then the fastest
+def leaderboard(records, top=10):
+    solved = [result for result in analyse_games(records) if result["solved"]]
+    solved.sort(key=lambda result: (result["wasted_moves"], result["time_taken"] or 0))
+    return solved[:top]
@@ -0,0 +1,133 @@
+import itertools
+import zlib
+from math import gcd
+from hanoi_engine import HanoiEngine, RODS
+
+# Packed binary encoding of Tower of Hanoi move sequences. With k rods
+# there are k * (k - 1) possible (from_rod, to_rod) moves, so each move
+# takes a fixed number of bits (3 for the 6 moves on 3 rods). k * (k - 1)
+# is never a power of two, so there is always a spare code, which marks
+# the end of the moves.
+#
+# Format: version byte, number of rods, flags (bit 0: zlib), then the
+# codes packed most significant bit first. Codes are written in groups
+# that fill a whole number of bytes (8 codes of 3 bits in 3 bytes), so
+# encoding and decoding can stream.
+
+FORMAT_VERSION = 1
+FLAG_ZLIB = 1
+CHUNK_MOVES = 1 << 14  # Moves encoded per yielded chunk
+
+
+class MoveCodec:
+    """Code tables for one number of rods."""
+
+    def __init__(self, num_rods=3):
+        if not 3 <= num_rods <= len(RODS):
+            raise ValueError(f"Number of rods must be between 3 and {len(RODS)}, got {num_rods}")
+        self.num_rods = num_rods
+        self.moves = [(a, b) for a in RODS[:num_rods] for b in RODS[:num_rods] if a != b]
+        self.codes = {move: code for code, move in enumerate(self.moves)}
+        self.end = len(self.moves)  # Spare code after the last move
+        self.bits = self.end.bit_length()
+        self.group_moves = 8 // gcd(self.bits, 8)  # Codes per group
+        self.group_bytes = self.bits * self.group_moves // 8
+
+    def encode(self, moves, compress=False, chunk_moves=CHUNK_MOVES):
+        # Generator of bytes chunks for an iterable of (from_rod, to_rod) moves
+        yield bytes([FORMAT_VERSION, self.num_rods, FLAG_ZLIB if compress else 0])
+        compressor = zlib.compressobj() if compress else None
+        codes, bits, group_moves, group_bytes = self.codes, self.bits, self.group_moves, self.group_bytes
+        out = bytearray()
+        value = count = written = 0
+        for move in moves:
+            try:
+                value = (value << bits) | codes[move]
+            except KeyError:
+                raise ValueError(f"Move {written + count + 1} {move!r} is not a move between two of "
+                                 f"the rods {', '.join(RODS[:self.num_rods])}") from None
+            count += 1
+            if count == group_moves:
+                out += value.to_bytes(group_bytes, "big")
+                written += count
+                value = count = 0
+                if written % chunk_moves == 0:
+                    yield compressor.compress(bytes(out)) if compressor else bytes(out)
+                    out.clear()
+
+        # End code, then zero codes to fill the last group
+        value = (value << bits) | self.end
+        value <<= bits * (group_moves - count - 1)
+        out += value.to_bytes(group_bytes, "big")
+        if compressor:
+            yield compressor.compress(bytes(out)) + compressor.flush()
+        else:
+            yield bytes(out)
+
+    def decode_codes(self, chunks):
+        # Generator of moves from the packed code bytes (header already read)
+        moves, end, bits = self.moves, self.end, self.bits
+        group_moves, group_bytes = self.group_moves, self.group_bytes
+        mask = (1 << bits) - 1
+        shifts = [bits * (group_moves - 1 - i) for i in range(group_moves)]
+        pending = b""
+        for chunk in chunks:
+            data = pending + chunk
+            usable = len(data) - len(data) % group_bytes
+            for start in range(0, usable, group_bytes):
+                value = int.from_bytes(data[start:start + group_bytes], "big")
+                for shift in shifts:
+                    code = (value >> shift) & mask
+                    if code == end:
+                        return
+                    if code > end:
+                        raise ValueError(f"Damaged packed moves: code {code} after {end} valid codes")
+                    yield moves[code]
+            pending = data[usable:]
+        raise ValueError("Packed moves end without an end code")
+
+
+# Pack a whole move sequence into bytes
+def pack_moves(moves, num_rods=3, compress=False):
+    return b"".join(MoveCodec(num_rods).encode(moves, compress))
+
+# Replay iterator: (from_rod, to_rod) moves from packed bytes, or from an
+# iterable of bytes chunks as produced by MoveCodec.encode()
+def iter_moves(data):
+    chunks = iter([data] if isinstance(data, (bytes, bytearray)) else data)
+    head = b""
+    for chunk in chunks:
+        head += chunk
+        if len(head) >= 3:
+            break
+    if len(head) < 3 or head[0] != FORMAT_VERSION:
+        raise ValueError("Not packed Hanoi moves")
+    codec = MoveCodec(head[1])
+    compressed = bool(head[2] & FLAG_ZLIB)
+
+    def body():
+        # The rest of the stream, decompressed if needed. Damaged zlib data
+        # is reported as a ValueError like any other damaged payload.
+        decompressor = zlib.decompressobj() if compressed else None
+        for chunk in itertools.chain([head[3:]], chunks):
+            if decompressor is None:
+                yield chunk
+                continue
+            try:
+                data = decompressor.decompress(chunk)
+            except zlib.error as e:
+                raise ValueError(f"Damaged compressed moves: {e}") from e
+            yield data
+
+    return codec.decode_codes(body())
+
+# Number of rods a packed sequence was written for
+def packed_num_rods(data):
+    return data[1]
+
+# Play packed moves on a new engine and return it; stops at the first
+# invalid move, like HanoiEngine.play()
+def replay(data, num_disks):
+    engine = HanoiEngine(num_disks, packed_num_rods(data))
+    engine.play(iter_moves(data), record=False)
+    return engine
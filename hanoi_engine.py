@@ -0,0 +1,222 @@
+import sys
+import time
+from collections.abc import Mapping, Sequence
+from hanoi_solver import HanoiSolver
+
+# Tower of Hanoi game state without any Tk code. Each rod is one integer
+# bitmask with bit d - 1 set when disk d is on it, so the top (smallest)
+# disk of a rod is its lowest set bit and a move is two bit operations.
+
+RODS = ("A", "B", "C", "D", "E", "F", "G", "H")  # Rod names, the game uses the first num_rods
+ROD_INDEX = {rod: i for i, rod in enumerate(RODS)}
+
+
+class HanoiEngine:
+
+    def __init__(self, num_disks=0, num_rods=3):
+        if not 3 <= num_rods <= len(RODS):
+            raise ValueError(f"Number of rods must be between 3 and {len(RODS)}, got {num_rods}")
+        self.num_rods = num_rods
+        self.rod_names = RODS[:num_rods]
+        self.target = num_rods - 1  # Disks start on the first rod and go to the last
+        self.reset(num_disks)
+
+    def reset(self, num_disks=None):
+        if num_disks is not None:
+            if num_disks < 0:
+                raise ValueError(f"Number of disks must be >= 0, got {num_disks}")
+            self.num_disks = num_disks
+        self.full = (1 << self.num_disks) - 1
+        self.masks = [self.full] + [0] * (self.num_rods - 1)  # All disks start on rod A
+        self.move_sequence = []  # (from_rod, to_rod) of every move made
+        self.num_moves = 0
+
+    @property
+    def rods(self):
+        # Live view of the rods as {rod: disks from bottom to top}, the
+        # format TowerOfHanoi uses; changes made through it go to the masks
+        return RodsView(self)
+
+    @rods.setter
+    def rods(self, rods):
+        # Set a whole position. The disks must be 1..n, each on one rod, and
+        # num_disks becomes n so is_solved() checks the new position.
+        masks = [0] * self.num_rods
+        count = 0
+        for rod, disks in rods.items():
+            if rod not in self.rod_names:
+                raise ValueError(f"Unknown rod {rod!r}, the game has rods {', '.join(self.rod_names)}")
+            disks = list(disks)
+            if any(lower <= upper for lower, upper in zip(disks, disks[1:])):
+                raise ValueError(f"Disks on rod {rod} must get smaller from bottom to top, got {disks}")
+            for disk in disks:
+                masks[ROD_INDEX[rod]] |= 1 << (disk - 1)
+            count += len(disks)
+        union = 0
+        for mask in masks:
+            union |= mask
+        num_disks = union.bit_length()
+        if count != num_disks or union != (1 << num_disks) - 1:
+            raise ValueError(f"Rods must hold disks 1 to {num_disks} once each, got {dict(rods)}")
+        self.num_disks = num_disks
+        self.full = (1 << num_disks) - 1
+        self.masks = masks
+
+    def top_disk(self, rod):
+        # Smallest disk on the rod, or None if it is empty
+        mask = self.masks[ROD_INDEX[rod]]
+        return (mask & -mask).bit_length() or None
+
+    def disk_below(self, disk):
+        # Disk directly under the given disk, or None if it is at the bottom
+        for mask in self.masks:
+            if mask >> (disk - 1) & 1:
+                rest = mask >> disk
+                return disk + (rest & -rest).bit_length() if rest else None
+        return None
+
+    def disk_position(self, disk):
+        # (rod, level) of a disk, level 0 being the bottom of the rod
+        for rod, mask in zip(RODS, self.masks):
+            if mask >> (disk - 1) & 1:
+                return rod, (mask >> disk).bit_count()
+        return None
+
+    def rod_height(self, rod):
+        return self.masks[ROD_INDEX[rod]].bit_count()
+
+    def is_valid_move(self, from_rod, to_rod):
+        source, target = self.masks[ROD_INDEX[from_rod]], self.masks[ROD_INDEX[to_rod]]
+        if from_rod == to_rod or not source:
+            return False
+        # The moving disk must be smaller than the top disk of the target rod
+        return not target or (source & -source) < (target & -target)
+
+    def move(self, from_rod, to_rod):
+        # Make the move if it is valid, and return whether it was made
+        if not self.is_valid_move(from_rod, to_rod):
+            return False
+        i, j = ROD_INDEX[from_rod], ROD_INDEX[to_rod]
+        top = self.masks[i] & -self.masks[i]
+        self.masks[i] ^= top
+        self.masks[j] |= top
+        self.move_sequence.append((from_rod, to_rod))
+        self.num_moves += 1
+        return True
+
+    def play(self, moves, record=True):
+        # Make a batch of (from_rod, to_rod) moves, stopping at the first
+        # invalid one. Returns how many moves were made. Same checks as
+        # move(), inlined for speed; record=False also skips move_sequence.
+        masks, index = self.masks, ROD_INDEX
+        append = self.move_sequence.append if record else None
+        played = 0
+        for from_rod, to_rod in moves:
+            i, j = index[from_rod], index[to_rod]
+            source, target = masks[i], masks[j]
+            top = source & -source
+            if i == j or not source or (target and top > (target & -target)):
+                break
+            masks[i] = source ^ top
+            masks[j] = target | top
+            played += 1
+            if append:
+                append((from_rod, to_rod))
+        self.num_moves += played
+        return played
+
+    def is_solved(self):
+        return self.masks[self.target] == self.full
+
+
+class RodsView(Mapping):
+    """{rod: RodStack} view of an engine, returned by HanoiEngine.rods."""
+
+    def __init__(self, engine):
+        self.engine = engine
+
+    def __getitem__(self, rod):
+        if rod not in self.engine.rod_names:
+            raise KeyError(rod)
+        return RodStack(self.engine, ROD_INDEX[rod])
+
+    def __setitem__(self, rod, disks):
+        rods = {name: list(stack) for name, stack in self.items()}
+        rods[rod] = list(disks)
+        self.engine.rods = rods
+
+    def __iter__(self):
+        return iter(self.engine.rod_names)
+
+    def __len__(self):
+        return self.engine.num_rods
+
+    def __repr__(self):
+        return repr({rod: list(stack) for rod, stack in self.items()})
+
+
+class RodStack(Sequence):
+    """Disks of one rod from bottom to top, read from and written to the engine's mask."""
+
+    def __init__(self, engine, index):
+        self.engine = engine
+        self.index = index
+
+    def _disks(self):
+        mask = self.engine.masks[self.index]
+        return [disk for disk in range(mask.bit_length(), 0, -1) if mask >> (disk - 1) & 1]
+
+    def __getitem__(self, index):
+        return self._disks()[index]
+
+    def __len__(self):
+        return self.engine.masks[self.index].bit_count()
+
+    def __iter__(self):
+        return iter(self._disks())
+
+    def __eq__(self, other):
+        return self._disks() == list(other) if isinstance(other, Sequence) else NotImplemented
+
+    def __repr__(self):
+        return repr(self._disks())
+
+    def append(self, disk):
+        # Put a disk on top. Like on a real rod it must be smaller than the
+        # top disk, and it must not be on another rod already.
+        engine = self.engine
+        mask = engine.masks[self.index]
+        if any(m >> (disk - 1) & 1 for m in engine.masks):
+            raise ValueError(f"Disk {disk} is already on a rod")
+        if mask and (mask & -mask).bit_length() < disk:
+            raise ValueError(f"Disk {disk} cannot go on disk {(mask & -mask).bit_length()}")
+        engine.masks[self.index] = mask | 1 << (disk - 1)
+        if disk > engine.num_disks:
+            engine.num_disks = disk
+            engine.full = (1 << disk) - 1
+
+    def pop(self):
+        # Take the top disk off the rod and return it
+        mask = self.engine.masks[self.index]
+        if not mask:
+            raise IndexError("pop from an empty rod")
+        top = mask & -mask
+        self.engine.masks[self.index] = mask ^ top
+        return top.bit_length()
+
+
+# Replay the optimal solution to measure moves per second
+def benchmark(num_disks=20, record=False):
+    moves = list(HanoiSolver(num_disks).moves("iterative"))
+    engine = HanoiEngine(num_disks)
+    start_time = time.perf_counter()
+    engine.play(moves, record)
+    elapsed = time.perf_counter() - start_time
+    return {"num_disks": num_disks, "moves": len(moves), "seconds": elapsed, "solved": engine.is_solved()}
+
+
+if __name__ == "__main__":
+    # Usage: python hanoi_engine.py [num_disks]
+    result = benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 20)
+    print(f"{result['moves']} moves in {result['seconds']:.3f} seconds "
+          f"({result['moves'] / result['seconds']:,.0f} moves/s), solved: {result['solved']}")
@@ -0,0 +1,144 @@
+import sys
+import time
+from itertools import islice
+
+# Optimal Tower of Hanoi solutions. Every strategy is a generator of
+# (from_rod, to_rod) moves, so even n=64 (2^64 - 1 moves) can be streamed
+# without building the whole list.
+
+
+class HanoiSolver:
+    STRATEGIES = ("recursive", "iterative", "gray")
+
+    def __init__(self, num_disks, source="A", spare="B", target="C"):
+        if not isinstance(num_disks, int) or num_disks < 0:
+            raise ValueError(f"Number of disks must be a whole number >= 0, got {num_disks!r}")
+        self.num_disks = num_disks
+        self.rods = (source, spare, target)
+
+    def move_count(self):
+        return (1 << self.num_disks) - 1
+
+    def moves(self, strategy="gray"):
+        if strategy == "recursive":
+            return self.recursive_moves()
+        if strategy == "iterative":
+            return self.iterative_moves()
+        if strategy == "gray":
+            return self.gray_moves()
+        raise ValueError(f"Unknown strategy {strategy!r}, expected one of {', '.join(self.STRATEGIES)}")
+
+    def recursive_moves(self):
+        # Classic recursion: move n-1 disks out of the way, the largest disk
+        # across, then the n-1 disks on top of it
+        def solve(n, source, spare, target):
+            if n == 0:
+                return
+            yield from solve(n - 1, source, target, spare)
+            yield source, target
+            yield from solve(n - 1, spare, source, target)
+
+        source, spare, target = self.rods
+        return solve(self.num_disks, source, spare, target)
+
+    def iterative_moves(self):
+        # Bit trick: move m goes from rod (m & (m - 1)) % 3 to rod
+        # ((m | (m - 1)) + 1) % 3. With rods numbered 0, 1, 2 this ends on
+        # rod 2 for odd n and on rod 1 for even n, so swap the last two
+        # rods for even n.
+        source, spare, target = self.rods
+        rods = (source, target, spare) if self.num_disks % 2 == 0 else self.rods
+        for m in range(1, self.move_count() + 1):
+            yield rods[(m & (m - 1)) % 3], rods[((m | (m - 1)) + 1) % 3]
+
+    def gray_moves(self, start=0):
+        # Gray code: move m moves disk d = number of trailing zero bits of m
+        # (0 is the smallest disk), and it is that disk's (m >> (d + 1))-th
+        # move. Each disk cycles through the rods in a fixed direction, so
+        # both rods follow in O(1) from those two numbers. Since every move
+        # stands alone, the moves can start after the first start moves.
+        n = self.num_disks
+        for m in range(start + 1, self.move_count() + 1):
+            d = (m & -m).bit_length() - 1
+            k = m >> (d + 1)
+            step = 1 if (n - d) % 2 == 0 else 2  # 2 is one step backwards
+            yield self.rods[(k * step) % 3], self.rods[((k + 1) * step) % 3]
+
+    def kth_move(self, k):
+        # The k-th move (1-based) of the optimal solution, with the same
+        # formula as gray_moves()
+        if not 1 <= k <= self.move_count():
+            raise ValueError(f"Move number must be between 1 and {self.move_count()}, got {k}")
+        d = (k & -k).bit_length() - 1
+        j = k >> (d + 1)
+        step = 1 if (self.num_disks - d) % 2 == 0 else 2
+        return self.rods[(j * step) % 3], self.rods[((j + 1) * step) % 3]
+
+    def state_after(self, k):
+        # Rods after the first k optimal moves, as {rod: disks from bottom to
+        # top}. Bit i of k (from the top) says whether disk n - i has already
+        # moved: if not, it is still on the source rod and the disks above it
+        # are moving to the spare rod; if so, it is on the target rod and the
+        # disks above it are moving from the spare rod onto it.
+        if not 0 <= k <= self.move_count():
+            raise ValueError(f"Move count must be between 0 and {self.move_count()}, got {k}")
+        source, spare, target = self.rods
+        state = {rod: [] for rod in self.rods}
+        for disk in range(self.num_disks, 0, -1):
+            half = 1 << (disk - 1)
+            if k < half:
+                state[source].append(disk)
+                spare, target = target, spare
+            else:
+                state[target].append(disk)
+                k -= half
+                source, spare = spare, source
+        return state
+
+    def progress(self, rods):
+        # Inverse of state_after(): the number of optimal moves that lead to
+        # the rods {rod: disks from bottom to top}, or None if the position
+        # is not on the optimal path
+        position = {}
+        for rod, disks in rods.items():
+            for disk in disks:
+                position[disk] = rod
+        if position.keys() != set(range(1, self.num_disks + 1)):
+            return None
+
+        source, spare, target = self.rods
+        k = 0
+        for disk in range(self.num_disks, 0, -1):
+            if position[disk] == source:
+                spare, target = target, spare
+            elif position[disk] == target:
+                k += 1 << (disk - 1)
+                source, spare = spare, source
+            else:
+                return None
+        return k
+
+
+# Time each strategy. For large n only the first limit moves are generated,
+# so the numbers compare the cost per move.
+def benchmark(num_disks, limit=1_000_000, strategies=HanoiSolver.STRATEGIES):
+    solver = HanoiSolver(num_disks)
+    moves = min(limit, solver.move_count())
+    results = []
+    for strategy in strategies:
+        start_time = time.perf_counter()
+        for _ in islice(solver.moves(strategy), moves):
+            pass
+        elapsed = time.perf_counter() - start_time
+        results.append({"strategy": strategy, "num_disks": num_disks, "moves": moves, "seconds": elapsed})
+    return results
+
+
+if __name__ == "__main__":
+    # Usage: python hanoi_solver.py [num_disks ...]
+    sizes = [int(arg) for arg in sys.argv[1:]] or [10, 20, 64]
+    for num_disks in sizes:
+        for row in benchmark(num_disks):
+            rate = row["moves"] / row["seconds"] if row["seconds"] else float("inf")
+            print(f"n={num_disks:>2} {row['strategy']:<10} {row['moves']} moves in "
+                  f"{row['seconds']:.3f} seconds ({rate:,.0f} moves/s)")
@@ -0,0 +1,26 @@
+import os
+import tempfile
+import frame_stewart
+
+# Shared test set-up for the Hanoi tests that reach the shared Frame-Stewart
+# table. Import setUpModule and tearDownModule into a test module to keep
+# the table's cache file in a temporary directory instead of the user's
+# cache directory.
+
+_cache_dir = None
+
+
+def setUpModule():
+    global _cache_dir
+    _cache_dir = tempfile.TemporaryDirectory()
+    frame_stewart.table_path = os.path.join(_cache_dir.name, "frame_stewart_table.json")
+    frame_stewart._table = None
+
+def tearDownModule():
+    frame_stewart.table_path = frame_stewart.DEFAULT_TABLE_PATH
+    frame_stewart._table = None
+    _cache_dir.cleanup()
+
+# Temporary directory in use while the module's tests run
+def cache_dir():
+    return _cache_dir.name
@@ -0,0 +1,10 @@
+"""N-Queens solver library shared by the sequential, threaded and game modules."""
+
+from nqueens.core import (
+    SOLUTION_COUNTS, count_n_queens, count_stack, generate_prefixes, is_safe, iter_bitmask,
+    pack_solution, unpack_solution,
+)
+from nqueens.min_conflicts import solve_min_conflicts
+from nqueens.parallel import count_n_queens_parallel, solve_n_queens_parallel
+from nqueens.strategies import STRATEGIES, Strategy, get_strategy, is_solution
+from nqueens.symmetry import expand_symmetries, solve_canonical, symmetries
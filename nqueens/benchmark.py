@@ -0,0 +1,97 @@
+"""Benchmark runner: times each strategy for a range of board sizes.
+
+Usage: python -m nqueens.benchmark --sizes 4 16 --csv results.csv --json results.json
+       python -m nqueens.benchmark --min-conflicts 1000 10000 100000 1000000
+"""
+
+import argparse
+import csv
+import json
+import time
+from nqueens import min_conflicts
+from nqueens.strategies import STRATEGIES, get_strategy
+
+FIELDS = ["strategy", "n", "mode", "solutions", "seconds"]
+
+
+# Time every strategy on every size. mode="count" calls count(n),
+# mode="solutions" consumes solutions(n). Once a strategy takes longer than
+# time_budget seconds for some n, it is skipped for the larger sizes.
+def run_benchmark(strategies=None, sizes=range(4, 17), mode="count", time_budget=None, workers=None):
+    if mode not in ("count", "solutions"):
+        raise ValueError(f"Unknown mode: {mode}")
+    results = []
+    for name in strategies or STRATEGIES:
+        options = {"workers": workers} if name == "multiprocess" else {}
+        strategy = get_strategy(name, **options)
+        for n in sizes:
+            start_time = time.perf_counter()
+            if mode == "count":
+                solutions = strategy.count(n)
+            else:
+                solutions = sum(1 for _ in strategy.solutions(n))
+            seconds = time.perf_counter() - start_time
+            results.append({"strategy": name, "n": n, "mode": mode, "solutions": solutions, "seconds": seconds})
+            if time_budget is not None and seconds > time_budget:
+                break
+    return results
+
+# Name of the fastest strategy for board size n in a set of results
+def fastest_strategy(results, n):
+    timings = [row for row in results if row["n"] == n]
+    if not timings:
+        return None
+    return min(timings, key=lambda row: row["seconds"])["strategy"]
+
+def write_csv(results, path):
+    with open(path, "w", newline="") as file:
+        writer = csv.DictWriter(file, fieldnames=FIELDS)
+        writer.writeheader()
+        writer.writerows(results)
+
+def write_json(results, path):
+    with open(path, "w") as file:
+        json.dump(results, file, indent=2)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the N-Queens strategies")
+    parser.add_argument("--sizes", nargs=2, type=int, default=[4, 16], metavar=("MIN", "MAX"))
+    parser.add_argument("--strategies", nargs="+", choices=list(STRATEGIES))
+    parser.add_argument("--mode", choices=["count", "solutions"], default="count")
+    parser.add_argument("--time-budget", type=float, default=60.0,
+                        help="skip larger sizes once a strategy takes longer than this (seconds)")
+    parser.add_argument("--workers", type=int)
+    parser.add_argument("--min-conflicts", nargs="+", type=int, metavar="N",
+                        help="time finding one solution with min-conflicts for these sizes instead")
+    parser.add_argument("--csv")
+    parser.add_argument("--json")
+    args = parser.parse_args(argv)
+
+    if args.min_conflicts:
+        results = min_conflicts.benchmark(args.min_conflicts)
+        for row in results:
+            print(f"n={row['n']:>8}: one solution in {row['seconds']:.2f} seconds")
+    else:
+        results = run_strategies(args)
+
+    if args.csv:
+        write_csv(results, args.csv)
+    if args.json:
+        write_json(results, args.json)
+    return results
+
+# Run and print the strategy benchmark for the parsed arguments
+def run_strategies(args):
+    sizes = range(args.sizes[0], args.sizes[1] + 1)
+    results = run_benchmark(args.strategies, sizes, args.mode, args.time_budget, args.workers)
+    for row in results:
+        print(f"{row['strategy']:>12} n={row['n']:<3} {row['solutions']:>10} solutions {row['seconds']:10.4f}s")
+    for n in sizes:
+        best = fastest_strategy(results, n)
+        if best:
+            print(f"Fastest for n={n}: {best}")
+    return results
+
+
+if __name__ == "__main__":
+    main()
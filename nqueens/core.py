@@ -0,0 +1,197 @@
+"""Core N-Queens search routines.
+
+Every solver works on the same representation: a board is a list of
+columns, board[row] being the column of the queen in that row.
+"""
+
+# Recursive function to solve the problem
+def solve(row, board, n, solutions):
+    if row == n:
+        solutions.append(board[:])
+        return
+    for col in range(n):
+        if is_safe(row, col, board):
+            board[row] = col
+            solve(row + 1, board, n, solutions)
+
+# Function to check if placing a queen at (row, col) is safe
+def is_safe(row, col, board):
+    for i in range(row):
+        if board[i] == col or abs(board[i] - col) == abs(i - row):
+            return False
+    return True
+
+# Bitmask version of solve(): columns and both diagonals are tracked as
+# integer bitmasks, so finding the free squares of a row is O(1)
+def solve_bitmask(row, board, n, solutions, cols=0, diag1=0, diag2=0):
+    if row == n:
+        solutions.append(board[:])
+        return
+    full = (1 << n) - 1
+    free = full & ~(cols | diag1 | diag2)
+    while free:
+        bit = free & -free  # Lowest free square in this row
+        free ^= bit
+        board[row] = bit.bit_length() - 1
+        solve_bitmask(row + 1, board, n, solutions,
+                      cols | bit, ((diag1 | bit) << 1) & full, (diag2 | bit) >> 1)
+
+# Count the solutions below a partial board without building any boards
+def count_bitmask(row, n, cols=0, diag1=0, diag2=0):
+    if row == n:
+        return 1
+    full = (1 << n) - 1
+    total = 0
+    free = full & ~(cols | diag1 | diag2)
+    while free:
+        bit = free & -free
+        free ^= bit
+        total += count_bitmask(row + 1, n, cols | bit, ((diag1 | bit) << 1) & full, (diag2 | bit) >> 1)
+    return total
+
+# Count-only version of count_bitmask() with an explicit stack instead of
+# recursion. Boards are never built, and the last row just counts its free
+# squares.
+def count_stack(n, row=0, cols=0, diag1=0, diag2=0):
+    if row == n:
+        return 1
+    full = (1 << n) - 1
+    last = n - 1
+    total = 0
+    stack = [(row, cols, diag1, diag2)]
+    while stack:
+        r, c, d1, d2 = stack.pop()
+        free = full & ~(c | d1 | d2)
+        if r == last:
+            total += free.bit_count()
+            continue
+        while free:
+            bit = free & -free
+            free ^= bit
+            stack.append((r + 1, c | bit, ((d1 | bit) << 1) & full, (d2 | bit) >> 1))
+    return total
+
+# Count all solutions. Boards with the first queen in the right half are
+# mirror images of the left half, so only the left half (and the middle
+# column of odd boards) is searched.
+def count_n_queens(n):
+    if n <= 1:
+        return 1
+    full = (1 << n) - 1
+    total = 0
+    for col in range((n + 1) // 2):
+        bit = 1 << col
+        count = count_stack(n, 1, bit, (bit << 1) & full, bit >> 1)
+        total += count if n % 2 and col == n // 2 else 2 * count
+    return total
+
+# Published solution counts for n = 0..20 (OEIS A000170), for callers that
+# need the total without searching; test_threaded_n_queens checks the small
+# ones against count_n_queens
+SOLUTION_COUNTS = (
+    1, 1, 0, 0, 2, 10, 4, 40, 92, 352, 724, 2680, 14200, 73712, 365596,
+    2279184, 14772512, 95815104, 666090624, 4968057848, 39029188884,
+)
+
+# Pack a solution into bytes, one byte per row holding the queen's column
+def pack_solution(solution):
+    return bytes(solution)
+
+# Turn a packed solution back into a list of columns
+def unpack_solution(packed):
+    return list(packed)
+
+# Generator version of solve(), yielding each solution as it is found
+def iter_recursive(row, board, n):
+    if row == n:
+        yield board[:]
+        return
+    for col in range(n):
+        if is_safe(row, col, board):
+            board[row] = col
+            yield from iter_recursive(row + 1, board, n)
+
+# Generator version of solve_bitmask(), yielding each solution as it is found
+def iter_bitmask_recursive(row, board, n, cols=0, diag1=0, diag2=0):
+    if row == n:
+        yield board[:]
+        return
+    full = (1 << n) - 1
+    free = full & ~(cols | diag1 | diag2)
+    while free:
+        bit = free & -free
+        free ^= bit
+        board[row] = bit.bit_length() - 1
+        yield from iter_bitmask_recursive(row + 1, board, n,
+                                          cols | bit, ((diag1 | bit) << 1) & full, (diag2 | bit) >> 1)
+
+# Generator version of solve_bitmask() using an explicit stack
+def iter_bitmask(n):
+    if n == 0:
+        yield []
+        return
+    full = (1 << n) - 1
+    board = [0] * n
+    free = [0] * n  # Squares still to try in each row
+    cols = [0] * n
+    diag1 = [0] * n
+    diag2 = [0] * n
+    free[0] = full
+    row = 0
+    while row >= 0:
+        if not free[row]:
+            row -= 1
+            continue
+        bit = free[row] & -free[row]
+        free[row] ^= bit
+        board[row] = bit.bit_length() - 1
+        if row == n - 1:
+            yield board[:]
+            continue
+        c = cols[row] | bit
+        d1 = ((diag1[row] | bit) << 1) & full
+        d2 = (diag2[row] | bit) >> 1
+        row += 1
+        cols[row], diag1[row], diag2[row] = c, d1, d2
+        free[row] = full & ~(c | d1 | d2)
+
+# Function to list the safe placements of the first `depth` rows
+def generate_prefixes(n, depth):
+    prefixes = []
+    _collect_prefixes(n, depth, [], 0, 0, 0, prefixes)
+    return prefixes
+
+def _collect_prefixes(n, depth, prefix, cols, diag1, diag2, prefixes):
+    if len(prefix) == depth:
+        prefixes.append(prefix[:])
+        return
+    full = (1 << n) - 1
+    free = full & ~(cols | diag1 | diag2)
+    while free:
+        bit = free & -free
+        free ^= bit
+        prefix.append(bit.bit_length() - 1)
+        _collect_prefixes(n, depth, prefix, cols | bit, ((diag1 | bit) << 1) & full, (diag2 | bit) >> 1, prefixes)
+        prefix.pop()
+
+# Column and diagonal bitmasks of the rows below a prefix
+def prefix_masks(n, prefix):
+    full = (1 << n) - 1
+    cols = diag1 = diag2 = 0
+    for col in prefix:
+        bit = 1 << col
+        cols |= bit
+        diag1 = ((diag1 | bit) << 1) & full
+        diag2 = (diag2 | bit) >> 1
+    return cols, diag1, diag2
+
+# Process worker: find every solution that starts with the given prefix
+def solve_prefix(n, prefix):
+    board = list(prefix) + [-1] * (n - len(prefix))
+    solutions = []
+    solve_bitmask(len(prefix), board, n, solutions, *prefix_masks(n, prefix))
+    return solutions
+
+# Process worker: count the solutions that start with the given prefix
+def count_prefix(n, prefix):
+    return count_stack(n, len(prefix), *prefix_masks(n, prefix))
@@ -0,0 +1,141 @@
+"""Hints for a partly filled board.
+
+The player can place queens in any rows, so the completion search keeps
+absolute bitmasks: one bit per column and one bit per diagonal of the
+whole board, instead of the row-relative shifted masks of the solvers in
+nqueens.core. At each step it fills the empty row with the fewest free
+squares first, and gives up once the time budget runs out.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+SOLVABLE = "solvable"  # The board can be completed, see "square" and "solution"
+UNSOLVABLE = "unsolvable"  # No completion exists, some queen has to move
+UNKNOWN = "unknown"  # The time budget ran out before the search finished
+
+
+class _OutOfTime(Exception):
+    pass
+
+
+# Column of the queen in each row of a 0/1 board grid, -1 for empty rows
+def placement_from_board(board):
+    return tuple(row.index(1) if 1 in row else -1 for row in board)
+
+# Find one full solution that keeps every placed queen, or None if there is
+# none. Raises _OutOfTime once time.perf_counter() passes deadline.
+def complete_placement(placement, deadline=None):
+    n = len(placement)
+    full = (1 << n) - 1
+    cols = diag1 = diag2 = 0  # diag1 bit row + col, diag2 bit col - row + n - 1
+    board = list(placement)
+    empty = []
+    for row, col in enumerate(placement):
+        if col < 0:
+            empty.append(row)
+            continue
+        bits = (1 << col, 1 << (row + col), 1 << (col - row + n - 1))
+        if cols & bits[0] or diag1 & bits[1] or diag2 & bits[2]:
+            return None  # Placed queens already attack each other
+        cols |= bits[0]
+        diag1 |= bits[1]
+        diag2 |= bits[2]
+
+    nodes = 0
+
+    def free_squares(row, cols, diag1, diag2):
+        # Shift the diagonal masks so bit col lines up with square (row, col)
+        return full & ~(cols | (diag1 >> row) | (diag2 >> (n - 1 - row)))
+
+    def search(empty, cols, diag1, diag2):
+        nonlocal nodes
+        if not empty:
+            return True
+        if deadline is not None and nodes % 1024 == 0 and time.perf_counter() > deadline:
+            raise _OutOfTime
+        nodes += 1
+
+        # Most constrained row first
+        best, best_free = None, None
+        for row in empty:
+            free = free_squares(row, cols, diag1, diag2)
+            if free == 0:
+                return False
+            if best is None or free.bit_count() < best_free.bit_count():
+                best, best_free = row, free
+
+        rest = [row for row in empty if row != best]
+        free = best_free
+        while free:
+            bit = free & -free
+            free ^= bit
+            col = bit.bit_length() - 1
+            board[best] = col
+            if search(rest, cols | bit, diag1 | (1 << (best + col)), diag2 | (1 << (col - best + n - 1))):
+                return True
+        board[best] = -1
+        return False
+
+    return board if search(empty, cols, diag1, diag2) else None
+
+
+class HintService:
+    """Answers hint requests for a live game, with a cache per placement.
+
+    hint() may be called from several worker threads at once: the cache and
+    last_solution are only touched under a lock, and every caller gets its
+    own copy of the result.
+    """
+
+    def __init__(self, time_budget=2.0, cache_size=1024):
+        self.time_budget = time_budget  # Seconds of search per hint
+        self.cache_size = cache_size
+        self.cache = OrderedDict()  # placement -> result, least recently used first
+        self.last_solution = None
+        self.lock = threading.Lock()
+
+    def hint(self, board):
+        # Hint for a 0/1 board grid such as NQueensGame.board. Returns a dict
+        # with "status", the suggested next "square" as (row, col) and the
+        # "solution" it leads to (both None unless the board is solvable).
+        placement = placement_from_board(board)
+        with self.lock:
+            if placement in self.cache:
+                self.cache.move_to_end(placement)
+                return _copy_result(self.cache[placement])
+            solution = self.last_solution
+
+        # A player who follows the last hint stays on the same solution. The
+        # search itself runs outside the lock.
+        if solution is None or len(solution) != len(placement) or any(
+                col >= 0 and col != solution[row] for row, col in enumerate(placement)):
+            try:
+                solution = complete_placement(placement, time.perf_counter() + self.time_budget)
+            except _OutOfTime:
+                # Not cached, a later request may get further
+                return {"status": UNKNOWN, "square": None, "solution": None}
+
+        if solution is None:
+            result = {"status": UNSOLVABLE, "square": None, "solution": None}
+        else:
+            square = next(((row, col) for row, col in enumerate(solution) if placement[row] < 0), None)
+            result = {"status": SOLVABLE, "square": square, "solution": list(solution)}
+
+        with self.lock:
+            if solution is not None:
+                self.last_solution = solution
+            self.cache[placement] = result
+            self.cache.move_to_end(placement)
+            if len(self.cache) > self.cache_size:
+                self.cache.popitem(last=False)
+        return _copy_result(result)
+
+
+# Copy of a cached result, so callers cannot change the cache
+def _copy_result(result):
+    result = dict(result)
+    if result["solution"] is not None:
+        result["solution"] = list(result["solution"])
+    return result
@@ -0,0 +1,49 @@
+"""Multiprocess solvers that split the search tree by prefixes."""
+
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from nqueens.core import count_n_queens, count_prefix, generate_prefixes, solve_prefix
+
+# Count-only parallel solver. The tree is cut into many small prefix
+# subtrees (three rows deep by default) that idle workers pull one at a
+# time from the shared task queue, so a worker that finishes a small
+# subtree immediately takes the next one instead of waiting for a big one.
+# Prefixes starting in the right half of the first row are mirror images
+# of the left half and are not searched.
+def count_n_queens_parallel(n, workers=None, prefix_depth=3):
+    prefix_depth = min(prefix_depth, n)
+    if n <= 1 or prefix_depth == n:
+        return count_n_queens(n)
+    prefixes = [p for p in generate_prefixes(n, prefix_depth) if 2 * p[0] < n]
+    total = 0
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(count_prefix, n, prefix): prefix for prefix in prefixes}
+        for future in as_completed(futures):
+            prefix = futures[future]
+            weight = 1 if n % 2 and prefix[0] == n // 2 else 2
+            total += weight * future.result()
+    return total
+
+# Split the search tree by prefixes and solve the subtrees in worker processes.
+# Prefixes never overlap, so the merged result has no duplicates and keeps
+# the same order as the sequential solver.
+def solve_n_queens_parallel(n, workers=None, prefix_depth=None):
+    if prefix_depth is None:
+        prefix_depth = 2 if n >= 6 else 1
+    prefix_depth = min(prefix_depth, n)
+    prefixes = generate_prefixes(n, prefix_depth)
+    solutions = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for part in executor.map(solve_prefix, [n] * len(prefixes), prefixes):
+            solutions.extend(part)
+    return solutions
+
+# Generator version of solve_n_queens_parallel(): subtrees are solved in
+# worker processes and their solutions yielded in prefix order
+def iter_solutions_parallel(n, workers=None, prefix_depth=None):
+    if prefix_depth is None:
+        prefix_depth = 2 if n >= 6 else 1
+    prefix_depth = min(prefix_depth, n)
+    prefixes = generate_prefixes(n, prefix_depth)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for part in executor.map(solve_prefix, [n] * len(prefixes), prefixes):
+            yield from part
@@ -0,0 +1,100 @@
+"""Interchangeable N-Queens solving strategies behind one interface."""
+
+from abc import ABC, abstractmethod
+from nqueens.core import (
+    count_bitmask, count_stack, is_safe, iter_bitmask, iter_bitmask_recursive, iter_recursive,
+)
+from nqueens.parallel import count_n_queens_parallel, iter_solutions_parallel
+from nqueens.symmetry import expand_solutions, solve_canonical, symmetries
+
+
+class Strategy(ABC):
+    """Base class: solutions(n) yields every solution as a list of columns,
+    count(n) returns how many there are."""
+
+    name = None
+
+    @abstractmethod
+    def solutions(self, n):
+        """Iterator over every solution of an n x n board."""
+
+    def count(self, n):
+        return sum(1 for _ in self.solutions(n))
+
+
+class RecursiveStrategy(Strategy):
+    """Plain backtracking that checks each square with is_safe."""
+
+    name = "recursive"
+
+    def solutions(self, n):
+        return iter_recursive(0, [-1] * n, n)
+
+
+class BitmaskStrategy(Strategy):
+    """Recursive backtracking with column and diagonal bitmasks."""
+
+    name = "bitmask"
+
+    def solutions(self, n):
+        return iter_bitmask_recursive(0, [-1] * n, n)
+
+    def count(self, n):
+        return count_bitmask(0, n)
+
+
+class IterativeStackStrategy(Strategy):
+    """Bitmask search on an explicit stack, no recursion."""
+
+    name = "iterative"
+
+    def solutions(self, n):
+        return iter_bitmask(n)
+
+    def count(self, n):
+        return count_stack(n)
+
+
+class SymmetryStrategy(Strategy):
+    """Searches canonical solutions only and expands their rotations and reflections."""
+
+    name = "symmetry"
+
+    def solutions(self, n):
+        return expand_solutions(solve_canonical(n))
+
+    def count(self, n):
+        return sum(len(set(symmetries(solution))) for solution in solve_canonical(n))
+
+
+class MultiprocessStrategy(Strategy):
+    """Prefix subtrees solved in a pool of worker processes."""
+
+    name = "multiprocess"
+
+    def __init__(self, workers=None):
+        self.workers = workers
+
+    def solutions(self, n):
+        return iter_solutions_parallel(n, self.workers)
+
+    def count(self, n):
+        return count_n_queens_parallel(n, self.workers)
+
+
+STRATEGIES = {
+    strategy.name: strategy
+    for strategy in (RecursiveStrategy, BitmaskStrategy, IterativeStackStrategy, SymmetryStrategy, MultiprocessStrategy)
+}
+
+
+# Create a strategy by name
+def get_strategy(name, **options):
+    if name not in STRATEGIES:
+        raise ValueError(f"Unknown strategy: {name}")
+    return STRATEGIES[name](**options)
+
+# Check a solution with is_safe, for callers that want to verify results
+def is_solution(solution):
+    n = len(solution)
+    return all(0 <= col < n and is_safe(row, col, solution) for row, col in enumerate(solution))
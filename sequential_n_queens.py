@@ -1,32 +1,56 @@
 import time
-from firebase_config import db
+from firestore_batch import save_in_batches
+from solution_rank import unrank_solution
+from nqueens.core import (
+    solve, is_safe, solve_bitmask, count_bitmask, count_stack, count_n_queens,
+    pack_solution, unpack_solution, iter_recursive, iter_bitmask,
+)
+from nqueens.symmetry import (
+    symmetries, is_canonical, expand_symmetries, solve_canonical, expand_solutions, solve_symmetric,
+)
 
 # Function to solve N-Queens problem and return all solutions
-def solve_n_queens(n):
+# engine="bitmask" (default) is the fast engine, engine="recursive" is the
+# original is_safe based solver, kept so the two can be benchmarked
+def solve_n_queens(n, engine="bitmask"):
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown engine: {engine}")
     solutions = []
     board = [-1] * n
-    solve(0, board, n, solutions)
+    ENGINES[engine](0, board, n, solutions)
     return solutions
 
-# Recursive function to solve the problem
-def solve(row, board, n, solutions):
-    if row == n:
-        solutions.append(board[:])
-        return
-    for col in range(n):
-        if is_safe(row, col, board):
-            board[row] = col
-            solve(row + 1, board, n, solutions)
-
-# Function to check if placing a queen at (row, col) is safe
-def is_safe(row, col, board):
-    for i in range(row):
-        if board[i] == col or abs(board[i] - col) == abs(i - row):
-            return False
-    return True
+# Available solver engines for solve_n_queens
+ENGINES = {
+    "recursive": solve,
+    "bitmask": solve_bitmask,
+    "symmetry": solve_symmetric,
+}
+
+# Generator over all solutions, so callers can consume them in constant
+# memory instead of building one huge list. With packed=True each solution
+# is yielded in the compact bytes form of pack_solution().
+def iter_solutions(n, engine="bitmask", packed=False):
+    if engine == "bitmask":
+        solutions = iter_bitmask(n)
+    elif engine == "recursive":
+        solutions = iter_recursive(0, [-1] * n, n)
+    elif engine == "symmetry":
+        solutions = expand_solutions(solve_canonical(n))
+    else:
+        raise ValueError(f"Unknown engine: {engine}")
+    if packed:
+        return (pack_solution(solution) for solution in solutions)
+    return solutions
+
+# Function to build the Firestore record of a solution
+# rank is the solution's position in the enumeration order (see
+# solution_rank). A ranked record stores only the board size and the rank,
+# a 32-bit integer, instead of the position strings.
+def solution_to_record(solution, rank=None):
+    if rank is not None:
+        return {"n": len(solution), "rank": rank}
 
-# Function to save a single solution to Firestore
-def save_solution_to_db(solution, db, collection_name="sequential_solutions"):
     queen_positions = []  # List to store the queen positions as strings (row, col)
     
     for row in range(len(solution)):
@@ -34,18 +58,56 @@ def save_solution_to_db(solution, db, collection_name="sequential_solutions"):
         # Store the queen's position as a string "(row,col)"
         queen_positions.append(f"({row + 1},{col + 1})")
 
-    # Store only the queen positions in Firestore
-    db.collection(collection_name).add({
+    return {
         "queen_positions": queen_positions  # List of strings representing positions
-    })
+    }
+
+# Function to read a solution back from a record made by solution_to_record.
+# Ranked records are unranked, through the catalogue for large boards.
+def record_to_solution(record, catalogue=None):
+    if "rank" in record:
+        return unrank_solution(record["n"], record["rank"], catalogue)
+    return [int(position.strip("()").split(",")[1]) - 1 for position in record["queen_positions"]]
+
+# Function to save a single solution to Firestore
+def save_solution_to_db(solution, db, collection_name="sequential_solutions", rank=None):
+    # Store the queen positions in Firestore
+    db.collection(collection_name).add(solution_to_record(solution, rank))
+
+# Function to save many solutions to Firestore in write batches.
+# solutions can be a generator such as iter_solutions(n), stored as position
+# strings. With ranked=True it holds (rank, solution) pairs instead and only
+# the ranks are stored, e.g. enumerate(iter_solutions(n)): the bitmask and
+# recursive engines yield solutions in rank order, the symmetry engine does not.
+def save_solutions_to_db(solutions, db, collection_name="sequential_solutions", ranked=False, **options):
+    if ranked:
+        records = (solution_to_record(solution, rank) for rank, solution in solutions)
+    else:
+        records = (solution_to_record(solution) for solution in solutions)
+    return save_in_batches(db, collection_name, records, **options)
 
 # Function to estimate time complexity (for reference)
 def estimate_time_complexity(n):
     import math
     return math.factorial(n)  # O(n!)
 
+# Function to time every engine on the same board size
+def benchmark_engines(n):
+    timings = {}
+    for engine in ENGINES:
+        start_time = time.time()
+        count = len(solve_n_queens(n, engine))
+        timings[engine] = (count, time.time() - start_time)
+    return timings
+
 if __name__ == "__main__":
-    n = 8  # n=16 is practically not possible
+    from firebase_config import db
+
+    n = 8  # The bitmask engine makes n=16 feasible, but saving it is not
+
+    # Compare the engines side by side
+    for engine, (count, seconds) in benchmark_engines(n).items():
+        print(f"{engine} engine: {count} solutions in {seconds:.2f} seconds")
 
     # Start time for solution generation
     start_time_gen = time.time()
@@ -63,10 +125,8 @@ if __name__ == "__main__":
     # Start time for saving solutions
     start_time_save = time.time()
 
-    # Save solutions to Firestore
-    for index, solution in enumerate(solutions):
-        print(f"Saving solution {index + 1} to Firestore...")
-        save_solution_to_db(solution, db)
+    # Save solutions to Firestore in batches
+    save_solutions_to_db(enumerate(solutions), db, ranked=True, progress=lambda saved: print(f"Saved {saved} solutions to Firestore..."))
 
     # End time for saving solutions
     end_time_save = time.time()
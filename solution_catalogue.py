@@ -0,0 +1,171 @@
+import mmap
+import os
+import struct
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from nqueens.core import generate_prefixes, solve_prefix
+
+# Catalogue file layout: header, then every solution in sorted order as a
+# fixed-width record. Boards up to 16x16 store two columns per byte.
+MAGIC = b"NQCAT1"
+HEADER = struct.Struct("<6sHQ")  # magic, n, number of solutions
+DEFAULT_PATH = "nqueens16.cat"
+
+# Number of bytes used to store one solution
+def record_size(n):
+    return (n + 1) // 2 if n <= 16 else n
+
+# Encode a solution (list of columns) as a catalogue record.
+# The encoding keeps the order of the column lists, so the records sort
+# the same way as the solutions.
+def encode_solution(solution):
+    n = len(solution)
+    if n > 16:
+        return bytes(solution)
+    value = 0
+    for col in solution:
+        value = (value << 4) | col
+    if n % 2:
+        value <<= 4
+    return value.to_bytes(record_size(n), "big")
+
+def decode_solution(record, n):
+    if n > 16:
+        return list(record)
+    value = int.from_bytes(record, "big")
+    if n % 2:
+        value >>= 4
+    return [(value >> (4 * (n - 1 - row))) & 0xF for row in range(n)]
+
+# Path of the found-bitmap stored beside a catalogue
+def found_path(path):
+    return path + ".found"
+
+# Write the catalogue of all n-Queens solutions to path.
+# Subtrees are solved in worker processes and written in prefix order, so
+# the file comes out sorted without holding every solution in memory.
+def build_catalogue(n, path, workers=None):
+    prefix_depth = min(2, n)
+    prefixes = generate_prefixes(n, prefix_depth)
+    count = 0
+    with open(path, "wb") as file:
+        file.write(HEADER.pack(MAGIC, n, 0))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for part in executor.map(solve_prefix, [n] * len(prefixes), prefixes):
+                file.write(b"".join(encode_solution(solution) for solution in part))
+                count += len(part)
+        file.seek(0)
+        file.write(HEADER.pack(MAGIC, n, count))
+
+    # Start with an empty found-bitmap
+    with open(found_path(path), "wb") as file:
+        file.write(bytes((count + 7) // 8))
+    return count
+
+
+class SolutionCatalogue:
+    """Memory-mapped, sorted catalogue of N-Queens solutions with a found-bitmap."""
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, "rb")
+        self._data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.n, self.count = HEADER.unpack_from(self._data, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a solution catalogue")
+        self.record_size = record_size(self.n)
+
+        # Create the bitmap if it is missing
+        bitmap_size = (self.count + 7) // 8
+        if not os.path.exists(found_path(path)):
+            with open(found_path(path), "wb") as file:
+                file.write(bytes(bitmap_size))
+        self._found_file = open(found_path(path), "r+b")
+        if bitmap_size:
+            self._found = mmap.mmap(self._found_file.fileno(), bitmap_size)
+        else:
+            self._found = bytearray()
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, index):
+        if not 0 <= index < self.count:
+            raise IndexError(index)
+        start = HEADER.size + index * self.record_size
+        return decode_solution(self._data[start:start + self.record_size], self.n)
+
+    def __contains__(self, solution):
+        return self.index(solution) is not None
+
+    def index(self, solution):
+        """Return the position of solution in the catalogue, or None if it is not a solution."""
+        if len(solution) != self.n or any(not 0 <= col < self.n for col in solution):
+            return None
+        key = encode_solution(solution)
+        size = self.record_size
+        low, high = 0, self.count
+        while low < high:
+            mid = (low + high) // 2
+            start = HEADER.size + mid * size
+            if self._data[start:start + size] < key:
+                low = mid + 1
+            else:
+                high = mid
+        start = HEADER.size + low * size
+        if low < self.count and self._data[start:start + size] == key:
+            return low
+        return None
+
+    def is_found(self, index):
+        return bool(self._found[index >> 3] & (1 << (index & 7)))
+
+    def mark_found(self, index):
+        self._found[index >> 3] |= 1 << (index & 7)
+
+    def claim(self, solution):
+        """Mark solution as found. Returns False if it is invalid or was already found."""
+        index = self.index(solution)
+        if index is None or self.is_found(index):
+            return False
+        self.mark_found(index)
+        return True
+
+    def found_count(self):
+        return int.from_bytes(self._found, "little").bit_count()
+
+    def reset_found(self):
+        self._found[:] = bytes(len(self._found))
+
+    def flush(self):
+        if isinstance(self._found, mmap.mmap):
+            self._found.flush()
+
+    def close(self):
+        self.flush()
+        if isinstance(self._found, mmap.mmap):
+            self._found.close()
+        self._found_file.close()
+        self._data.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+# Open the catalogue at path, or return None if it has not been built yet
+def open_catalogue(path=DEFAULT_PATH):
+    if not os.path.exists(path):
+        return None
+    return SolutionCatalogue(path)
+
+
+if __name__ == "__main__":
+    # Usage: python solution_catalogue.py [n] [path]
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 16
+    path = sys.argv[2] if len(sys.argv) > 2 else DEFAULT_PATH
+    count = build_catalogue(n, path)
+    print(f"Catalogue of {count} solutions for n={n} written to {path}")
@@ -0,0 +1,91 @@
+from functools import lru_cache
+
+# Rank of a solution = its position in the enumeration order of
+# solve_n_queens (lexicographic order of the column lists). Ranks of boards
+# up to n=16 fit in 32 bits, so claimed solutions can be stored and
+# compared as plain integers.
+#
+# Without a catalogue the rank is found by counting subtrees in pure Python,
+# which is only quick for small boards: n=12 takes up to about a second,
+# n=16 would walk most of its 14772512 solutions. Larger boards need the
+# catalogue.
+
+MAX_TREE_N = 12  # Largest board ranked without a catalogue
+
+
+# Count the solutions that complete a partial board given as bitmasks
+@lru_cache(maxsize=1 << 16)
+def _count(n, row, cols, diag1, diag2):
+    if row == n:
+        return 1
+    full = (1 << n) - 1
+    total = 0
+    free = full & ~(cols | diag1 | diag2)
+    while free:
+        bit = free & -free
+        free ^= bit
+        total += _count(n, row + 1, cols | bit, ((diag1 | bit) << 1) & full, (diag2 | bit) >> 1)
+    return total
+
+# Generator over (column, number of completions) for each safe square of
+# the next row, together with the masks after placing that queen
+def _children(n, row, cols, diag1, diag2):
+    full = (1 << n) - 1
+    free = full & ~(cols | diag1 | diag2)
+    while free:
+        bit = free & -free
+        free ^= bit
+        child = (cols | bit, ((diag1 | bit) << 1) & full, (diag2 | bit) >> 1)
+        yield bit.bit_length() - 1, child, _count(n, row + 1, *child)
+
+# Boards above MAX_TREE_N are too slow to rank by counting subtrees
+def _check_tree_size(n):
+    if n > MAX_TREE_N:
+        raise ValueError(f"Ranking {n}-Queens boards needs a catalogue (at most {MAX_TREE_N} without one)")
+
+# Function to turn a solution into its rank.
+# With a catalogue (see solution_catalogue) this is a binary search,
+# otherwise the solutions before it are counted subtree by subtree.
+def rank_solution(solution, catalogue=None):
+    if catalogue is not None and catalogue.n == len(solution):
+        rank = catalogue.index(solution)
+        if rank is None:
+            raise ValueError(f"Not a valid solution: {solution}")
+        return rank
+
+    n = len(solution)
+    _check_tree_size(n)
+    rank = 0
+    masks = (0, 0, 0)
+    for row, target in enumerate(solution):
+        for col, child, count in _children(n, row, *masks):
+            if col == target:
+                masks = child
+                break
+            rank += count
+        else:
+            raise ValueError(f"Not a valid solution: {solution}")
+    return rank
+
+# Function to turn a rank back into its solution
+def unrank_solution(n, rank, catalogue=None):
+    if catalogue is not None and catalogue.n == n:
+        if not 0 <= rank < len(catalogue):
+            raise ValueError(f"Rank out of range: {rank}")
+        return catalogue[rank]
+
+    _check_tree_size(n)
+    if rank < 0:
+        raise ValueError(f"Rank out of range: {rank}")
+    solution = []
+    masks = (0, 0, 0)
+    for row in range(n):
+        for col, child, count in _children(n, row, *masks):
+            if rank < count:
+                solution.append(col)
+                masks = child
+                break
+            rank -= count
+        else:
+            raise ValueError("Rank out of range")
+    return solution
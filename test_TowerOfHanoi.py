@@ -4,6 +4,8 @@ import time
 import tkinter as tk
 import uuid
 from TowerOfHanoi import TowerOfHanoi
+from hanoi_codec import iter_moves
+from hanoi_solver import HanoiSolver
 
 class TestTowerOfHanoi(unittest.TestCase):
     def setUp(self):
@@ -115,6 +117,74 @@ class TestTowerOfHanoi(unittest.TestCase):
         finally:
             print("Finished test_check_win")
 
+    def test_move_disk(self):
+        print("Starting test_move_disk")
+        try:
+            self.app.num_disks.set("3")
+            self.app.start_game()
+            item = self.app.disk_items[1]
+            other_coords = self.app.canvas.coords(self.app.disk_items[3])
+            self.app.rods["A"].pop()
+            self.app.rods["C"].append(1)
+            self.app.move_disk(item, "A", "C")
+            print(f"Disks after move: {self.app.disks}")
+            self.assertEqual(self.app.disks[item], ("C", 1))
+            self.assertEqual(self.app.canvas.coords(item), [490.0, 280.0, 510.0, 300.0])
+            self.assertEqual(self.app.canvas.coords(self.app.disk_items[3]), other_coords)
+            self.assertEqual(self.app.canvas.itemcget(self.app.disk_items[2], "outline"), "yellow")
+            print("test_move_disk passed")
+        except AssertionError as e:
+            print("test_move_disk failed")
+            raise e
+        finally:
+            print("Finished test_move_disk")
+
+    def test_auto_solve(self):
+        print("Starting test_auto_solve")
+        try:
+            self.app.num_disks.set("6")
+            self.app.start_game()
+            self.app.auto_speed.set(5)
+            self.app.toggle_auto_solve()
+            self.assertTrue(self.app.auto_solving)
+            while self.app.auto_solving:
+                time.sleep(0.02)
+                self.app.auto_solve_frame()
+            print(f"Rods state after auto-solve: {self.app.rods}")
+            self.assertEqual(self.app.rods["C"], [6, 5, 4, 3, 2, 1])
+            self.assertEqual(self.app.num_moves, 63)
+            self.assertIn("Solved automatically", self.app.result_label.cget("text"))
+            print("test_auto_solve passed")
+        except AssertionError as e:
+            print("test_auto_solve failed")
+            raise e
+        finally:
+            print("Finished test_auto_solve")
+
+    def test_auto_solve_then_finish_by_hand(self):
+        print("Starting test_auto_solve_then_finish_by_hand")
+        try:
+            self.app.num_disks.set("3")
+            self.app.start_game()
+            self.app.toggle_auto_solve()
+            self.app.auto_budget = 3  # Three moves due in the next frame
+            self.app.auto_solve_frame()
+            self.app.stop_auto_solve()
+            self.assertEqual(self.app.num_moves, 3)
+            self.app.save_game_result = MagicMock()
+            for from_rod, to_rod in HanoiSolver(3).gray_moves(start=3):
+                self.assertTrue(self.app.engine.move(from_rod, to_rod))
+            self.app.check_win()
+            print(f"Result label text: {self.app.result_label.cget('text')}")
+            self.app.save_game_result.assert_not_called()
+            self.assertIn("auto-solve", self.app.result_label.cget("text"))
+            print("test_auto_solve_then_finish_by_hand passed")
+        except AssertionError as e:
+            print("test_auto_solve_then_finish_by_hand failed")
+            raise e
+        finally:
+            print("Finished test_auto_solve_then_finish_by_hand")
+
     @patch('TowerOfHanoi.firestore')
     def test_save_game_result(self, mock_firestore):
         print("Starting test_save_game_result")
@@ -148,6 +218,7 @@ class TestTowerOfHanoi(unittest.TestCase):
             self.assertEqual(saved_data["moves"], 10)
             self.assertAlmostEqual(saved_data["time_taken"], 60, delta=1)
             self.assertEqual(saved_data["move_sequence"], "AC,AB,CB")
+            self.assertEqual(list(iter_moves(saved_data["move_data"])), [("A", "C"), ("A", "B"), ("C", "B")])
             print("test_save_game_result passed")
         except AssertionError as e:
             print("test_save_game_result failed")
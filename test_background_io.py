@@ -0,0 +1,75 @@
+import threading
+import unittest
+from unittest.mock import MagicMock
+from background_io import BackgroundIO
+
+
+class TestBackgroundIO(unittest.TestCase):
+
+    def setUp(self):
+        # Mock the Tkinter root; after() callbacks are run by hand
+        self.root = MagicMock()
+        self.io = BackgroundIO(self.root, poll_interval=10)
+
+    def tearDown(self):
+        self.io.shutdown()
+
+    def run_after_callbacks(self):
+        while self.root.after.call_args_list:
+            calls = self.root.after.call_args_list[:]
+            self.root.after.reset_mock()
+            for call in calls:
+                call.args[1]()
+
+    def test_result_delivered_on_poll(self):
+        # Test the callback only runs when the queue is polled, not on the worker thread
+        release = threading.Event()
+        results = []
+        future = self.io.submit(lambda: release.wait() and "saved", on_done=results.append)
+        self.assertEqual(results, [])  # submit returns without waiting
+        release.set()
+        future.result(timeout=5)
+        self.run_after_callbacks()
+        self.assertEqual(results, ["saved"])
+        self.assertFalse(self.io.polling)
+
+    def test_error_delivered(self):
+        # Test exceptions from the worker reach on_error
+        errors = []
+
+        def fail():
+            raise ConnectionError("offline")
+
+        self.io.submit(fail, on_error=errors.append).exception(timeout=5)
+        self.run_after_callbacks()
+        self.assertIsInstance(errors[0], ConnectionError)
+
+    def test_keeps_polling_while_pending(self):
+        # Test polling continues until every task has reported back
+        release = threading.Event()
+        results = []
+        self.io.submit(release.wait, on_done=results.append)
+        self.io.poll()
+        self.assertTrue(self.io.polling)
+        self.root.after.assert_called_with(10, self.io.poll)
+        release.set()
+        self.io.executor.shutdown(wait=True)
+        self.run_after_callbacks()
+        self.assertEqual(results, [True])
+
+    def test_failing_callback(self):
+        # Test a callback that raises does not stop later results
+        def broken(result):
+            raise RuntimeError("callback bug")
+
+        results = []
+        self.io.submit(lambda: 1, on_done=broken).result(timeout=5)
+        self.run_after_callbacks()
+        self.assertFalse(self.io.polling)
+        self.io.submit(lambda: 2, on_done=results.append).result(timeout=5)
+        self.run_after_callbacks()
+        self.assertEqual(results, [2])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,48 @@
+import unittest
+import numpy as np
+from batch_validator import validate_boards, boards_from_packed
+from sequential_n_queens import iter_solutions, solve_n_queens, is_safe
+
+
+# Reference check with is_safe, one square at a time
+def scan_is_valid(board):
+    n = len(board)
+    return all(0 <= col < n for col in board) and all(is_safe(row, col, board) for row, col in enumerate(board))
+
+
+class TestBatchValidator(unittest.TestCase):
+
+    def test_all_solutions_are_valid(self):
+        # Test every real solution passes
+        boards = boards_from_packed(iter_solutions(8, packed=True), 8)
+        self.assertEqual(boards.shape, (92, 8))
+        self.assertTrue(validate_boards(boards).all())
+
+    def test_matches_scalar_check(self):
+        # Test random boards against the one-square-at-a-time check
+        rng = np.random.default_rng(3)
+        boards = np.vstack([rng.integers(0, 6, size=(5000, 6)), np.array(solve_n_queens(6))])
+        expected = [scan_is_valid(list(board)) for board in boards]
+        self.assertEqual(validate_boards(boards, chunk_size=777).tolist(), expected)
+
+    def test_conflicts(self):
+        # Test column, diagonal and out of range conflicts are caught
+        mask = validate_boards([
+            [1, 3, 0, 2],  # Valid
+            [1, 1, 0, 2],  # Same column
+            [0, 1, 3, 2],  # Same diagonal
+            [3, 0, 2, 1],  # Same anti-diagonal
+            [1, 3, 0, 6],  # Off the board
+        ])
+        self.assertEqual(mask.tolist(), [True, False, False, False, False])
+
+    def test_bad_shape(self):
+        # Test input that is not a 2-D integer array is rejected
+        with self.assertRaises(ValueError):
+            validate_boards([1, 3, 0, 2])
+        with self.assertRaises(ValueError):
+            validate_boards([[1.0, 3.0, 0.0, 2.0]])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,56 @@
+import unittest
+from itertools import count
+from unittest.mock import MagicMock
+from board import BoardRenderer
+
+
+class TestBoardRenderer(unittest.TestCase):
+
+    def setUp(self):
+        # Mock the Tkinter canvas so no window is needed
+        self.canvas = MagicMock()
+        ids = count(1)
+        self.canvas.create_rectangle.side_effect = lambda *a, **k: next(ids)
+        self.canvas.create_text.side_effect = lambda *a, **k: next(ids)
+        self.renderer = BoardRenderer(self.canvas, 4, 40, 40)
+        self.board = [[0] * 4 for _ in range(4)]
+
+    def run_idle_callbacks(self):
+        for call in self.canvas.after_idle.call_args_list:
+            call.args[0]()
+        self.canvas.after_idle.reset_mock()
+
+    def test_items_created_once(self):
+        # Test the squares and queen items are created up front
+        self.assertEqual(self.canvas.create_rectangle.call_count, 16)
+        self.assertEqual(self.canvas.create_text.call_count, 16)
+
+    def test_only_changed_cells_redrawn(self):
+        # Test a move touches only the changed cell
+        self.board[1][2] = 1
+        self.renderer.update(self.board, [(1, 2)])
+        self.run_idle_callbacks()
+        self.canvas.itemconfigure.assert_called_once_with(self.renderer.queens[(1, 2)], state="normal")
+        self.canvas.delete.assert_not_called()
+
+    def test_updates_batched_in_one_idle_callback(self):
+        # Test several updates before the idle callback are drawn together
+        self.board[0][0] = 1
+        self.renderer.update(self.board, [(0, 0)])
+        self.board[0][0] = 0
+        self.board[3][3] = 1
+        self.renderer.update(self.board, [(0, 0), (3, 3)])
+        self.assertEqual(self.canvas.after_idle.call_count, 1)
+        self.run_idle_callbacks()
+        self.canvas.itemconfigure.assert_called_once_with(self.renderer.queens[(3, 3)], state="normal")
+
+    def test_full_refresh(self):
+        # Test an update without cells compares the whole board
+        self.board[2][1] = 1
+        self.renderer.update(self.board)
+        self.run_idle_callbacks()
+        self.canvas.itemconfigure.assert_called_once_with(self.renderer.queens[(2, 1)], state="normal")
+
+
+if __name__ == "__main__":
+    unittest.main()
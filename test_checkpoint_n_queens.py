@@ -0,0 +1,47 @@
+import json
+import os
+import tempfile
+import unittest
+from checkpoint_n_queens import solve_with_checkpoints, load_checkpoint
+from threaded_n_queens import generate_prefixes, count_prefix
+
+
+class TestCheckpointedSearch(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp_dir.name, "run.json")
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_full_run(self):
+        # Test a fresh run counts every solution and records every subtree
+        self.assertEqual(solve_with_checkpoints(9, self.path, workers=1), 352)
+        with open(self.path) as file:
+            checkpoint = json.load(file)
+        self.assertEqual(len(checkpoint["completed"]), len(generate_prefixes(9, 2)))
+
+    def test_resume_skips_finished_subtrees(self):
+        # Test a run resumed from a partial checkpoint finishes with the right count
+        prefixes = generate_prefixes(8, 2)
+        done = prefixes[:5]
+        with open(self.path, "w") as file:
+            json.dump({"n": 8, "prefix_depth": 2, "completed": done,
+                       "count": sum(count_prefix(8, p) for p in done)}, file)
+
+        seen = []
+        count = solve_with_checkpoints(8, self.path, workers=1,
+                                       on_solutions=lambda prefix, solutions: seen.append(prefix))
+        self.assertEqual(count, 92)
+        self.assertEqual(sorted(seen), prefixes[5:])
+
+    def test_mismatched_checkpoint(self):
+        # Test a checkpoint from a different run is rejected
+        solve_with_checkpoints(6, self.path, workers=1)
+        with self.assertRaises(ValueError):
+            load_checkpoint(self.path, 7, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,116 @@
+import threading
+import unittest
+from firestore_batch import MAX_BATCH_SIZE, save_in_batches
+from sequential_n_queens import iter_solutions, record_to_solution, save_solutions_to_db, solve_n_queens
+
+
+class InMemoryFirestore:
+    """Local stand-in for the parts of the Firestore client used by batched writes."""
+
+    def __init__(self, failures=0, lost_acks=0):
+        self.collections = {}
+        self.failures = failures  # Number of commits that fail before succeeding
+        self.lost_acks = lost_acks  # Number of commits applied but reported as failed
+        self.commits = []
+        self.lock = threading.Lock()
+        self.next_id = 0
+
+    def collection(self, name):
+        return InMemoryCollection(self, name)
+
+    def batch(self):
+        return InMemoryBatch(self)
+
+
+class InMemoryCollection:
+    def __init__(self, db, name):
+        self.db = db
+        self.name = name
+
+    def document(self):
+        with self.db.lock:
+            self.db.next_id += 1
+            return (self.name, f"doc{self.db.next_id}")
+
+
+class InMemoryBatch:
+    def __init__(self, db):
+        self.db = db
+        self.writes = []
+
+    def set(self, ref, data):
+        self.writes.append((ref, data))
+
+    def commit(self):
+        if len(self.writes) > MAX_BATCH_SIZE:
+            raise ValueError("Too many writes in one batch")
+        with self.db.lock:
+            if self.db.failures > 0:
+                self.db.failures -= 1
+                raise ConnectionError("Simulated outage")
+            for (name, doc_id), data in self.writes:
+                self.db.collections.setdefault(name, {})[doc_id] = data
+            self.db.commits.append(len(self.writes))
+            if self.db.lost_acks > 0:
+                self.db.lost_acks -= 1
+                raise TimeoutError("Simulated deadline exceeded")
+
+
+class TestSaveInBatches(unittest.TestCase):
+
+    def test_batches_of_max_size(self):
+        # Test records are written in full batches and progress is reported
+        db = InMemoryFirestore()
+        progress = []
+        saved = save_in_batches(db, "records", ({"i": i} for i in range(1234)), progress=progress.append)
+        self.assertEqual(saved, 1234)
+        self.assertEqual(sorted(db.commits), [234, 500, 500])
+        self.assertEqual(sorted(r["i"] for r in db.collections["records"].values()), list(range(1234)))
+        self.assertEqual(progress[-1], 1234)
+        self.assertEqual(progress, sorted(progress))
+
+    def test_retry_with_backoff(self):
+        # Test failed commits are retried
+        db = InMemoryFirestore(failures=2)
+        saved = save_in_batches(db, "records", [{"i": i} for i in range(10)], backoff=0)
+        self.assertEqual(saved, 10)
+        self.assertEqual(len(db.collections["records"]), 10)
+
+    def test_retry_after_applied_commit(self):
+        # Test a retry after a commit that was applied does not duplicate records
+        db = InMemoryFirestore(lost_acks=1)
+        saved = save_in_batches(db, "records", [{"i": i} for i in range(10)], backoff=0)
+        self.assertEqual(saved, 10)
+        self.assertEqual(len(db.collections["records"]), 10)
+
+    def test_gives_up_after_max_retries(self):
+        # Test the error is raised once the retries run out
+        db = InMemoryFirestore(failures=5)
+        with self.assertRaises(ConnectionError):
+            save_in_batches(db, "records", [{"i": 0}], max_retries=2, backoff=0)
+
+    def test_invalid_batch_size(self):
+        # Test batch sizes over the Firestore limit are rejected
+        with self.assertRaises(ValueError):
+            save_in_batches(InMemoryFirestore(), "records", [], batch_size=501)
+
+    def test_save_solutions(self):
+        # Test saving every 8-Queens solution streamed from the generator
+        db = InMemoryFirestore()
+        saved = save_solutions_to_db(enumerate(iter_solutions(8)), db, ranked=True, batch_size=10, max_workers=2)
+        self.assertEqual(saved, 92)
+        records = db.collections["sequential_solutions"].values()
+        self.assertEqual(sorted(r["rank"] for r in records), list(range(92)))
+        self.assertEqual(sorted(record_to_solution(r) for r in records), solve_n_queens(8))
+
+    def test_save_unranked_solutions(self):
+        # Test solutions not in rank order are stored as positions
+        db = InMemoryFirestore()
+        save_solutions_to_db(iter_solutions(8, "symmetry"), db)
+        records = db.collections["sequential_solutions"].values()
+        self.assertTrue(all("rank" not in r for r in records))
+        self.assertEqual(sorted(record_to_solution(r) for r in records), solve_n_queens(8))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+import json
+import os
+import tempfile
+import unittest
+import frame_stewart
+from frame_stewart import FrameStewartSolver, SplitTable, load_split_table, optimal_moves
+from hanoi_engine import HanoiEngine
+from hanoi_testing import cache_dir, setUpModule, tearDownModule  # Temporary table cache
+
+# Frame-Stewart numbers for 4 rods, n = 1..10
+FOUR_RODS = [1, 3, 5, 9, 13, 17, 25, 33, 41, 49]
+
+
+class TestFrameStewart(unittest.TestCase):
+
+    def test_split_table(self):
+        # Test the table against the known 3- and 4-rod move counts
+        table = SplitTable(10, 5)
+        self.assertEqual(table.moves[3][1:], [2 ** n - 1 for n in range(1, 11)])
+        self.assertEqual(table.moves[4][1:], FOUR_RODS)
+        self.assertEqual(table.moves[5][10], 31)
+        self.assertTrue(table.covers(10, 5))
+        self.assertFalse(table.covers(11, 5))
+
+    def test_moves_solve_the_game(self):
+        # Test the generated moves are legal, solve the game and are as short as the table says
+        table = SplitTable(12, 6)
+        for num_rods in range(3, 7):
+            for num_disks in range(0, 13):
+                solver = FrameStewartSolver(num_disks, num_rods, table)
+                engine = HanoiEngine(num_disks, num_rods)
+                moves = list(solver.moves())
+                self.assertEqual(len(moves), solver.move_count())
+                self.assertEqual(engine.play(moves), len(moves))
+                self.assertTrue(engine.is_solved(), (num_disks, num_rods))
+
+    def test_table_is_cached_on_disk(self):
+        # Test the table is written once, reused, and grown when too small
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "table.json")
+            table = load_split_table(path, max_disks=8, max_rods=4)
+            self.assertTrue(os.path.exists(path))
+            self.assertEqual(load_split_table(path, max_disks=5, max_rods=4).moves, table.moves)
+
+            bigger = load_split_table(path, max_disks=20, max_rods=5)
+            self.assertTrue(bigger.covers(20, 5))
+            with open(path) as file:
+                self.assertEqual(json.load(file)["max_disks"], 20)
+
+    def test_shared_table_uses_table_path(self):
+        # Test the shared table is cached at table_path, creating its directory
+        frame_stewart._table = None
+        frame_stewart.table_path = os.path.join(cache_dir(), "sub", "table.json")
+        try:
+            self.assertEqual(optimal_moves(10, 4), 49)
+            self.assertTrue(os.path.exists(frame_stewart.table_path))
+        finally:
+            frame_stewart.table_path = os.path.join(cache_dir(), "frame_stewart_table.json")
+
+    def test_optimal_moves(self):
+        # Test the optimum for 3 rods is 2^n - 1 and far smaller with more rods
+        self.assertEqual(optimal_moves(64, 3), 2 ** 64 - 1)
+        self.assertEqual(optimal_moves(10, 4), 49)
+        self.assertLess(optimal_moves(64, 4), 2 ** 20)
+
+    def test_invalid_input(self):
+        # Test bad disk and rod counts are rejected
+        with self.assertRaises(ValueError):
+            FrameStewartSolver(-1)
+        with self.assertRaises(ValueError):
+            FrameStewartSolver(3, 2)
+        with self.assertRaises(ValueError):
+            HanoiEngine(3, 9)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,60 @@
+import random
+import unittest
+from game_logic import NQueensGame
+
+
+# Reference check that scans the whole board
+def scan_is_valid(board, row, col):
+    size = len(board)
+    for i in range(size):
+        for j in range(size):
+            if board[i][j] == 1 and (i == row or j == col or abs(row - i) == abs(col - j)):
+                return False
+    return True
+
+
+class TestNQueensGame(unittest.TestCase):
+
+    def test_counters_match_board_scan(self):
+        # Test random clicks against a full board scan
+        random.seed(7)
+        game = NQueensGame(8)
+        for _ in range(2000):
+            row, col = random.randrange(8), random.randrange(8)
+            expected_valid = game.board[row][col] == 1 or scan_is_valid(game.board, row, col)
+            self.assertEqual(game.place_or_remove_queen(row, col), expected_valid)
+
+            safe = {(i, j) for i in range(8) for j in range(8) if scan_is_valid(game.board, i, j)}
+            self.assertEqual(game.safe_squares, safe)
+            self.assertEqual(game.columns, [r.index(1) if 1 in r else -1 for r in game.board])
+
+    def test_remove_restores_safe_squares(self):
+        # Test placing and removing a queen leaves every square safe again
+        game = NQueensGame(16)
+        game.place_or_remove_queen(5, 9)
+        self.assertNotIn((5, 0), game.safe_squares)
+        self.assertNotIn((0, 4), game.safe_squares)
+        game.place_or_remove_queen(5, 9)
+        self.assertEqual(len(game.safe_squares), 256)
+        self.assertEqual(game.queens_left, 16)
+        self.assertEqual(game.move_paths, ["P(5, 9)", "R(5, 9)"])
+
+    def test_board_key_ignores_move_order(self):
+        # Test the same final board gives the same key whatever the click order
+        solution = [0, 4, 7, 5, 2, 6, 1, 3]
+        first, second = NQueensGame(8), NQueensGame(8)
+        for row in range(8):
+            first.place_or_remove_queen(row, solution[row])
+        second.place_or_remove_queen(7, 0)
+        second.place_or_remove_queen(7, 0)
+        for row in reversed(range(8)):
+            second.place_or_remove_queen(row, solution[row])
+        self.assertNotEqual(first.move_paths, second.move_paths)
+        self.assertEqual(first.board_key(), "04752613")
+        self.assertEqual(second.board_key(), first.board_key())
+        self.assertEqual(len(NQueensGame(16).board_key()), 16)
+        self.assertEqual(len(NQueensGame(20).board_key()), 40)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,115 @@
+import unittest
+from hanoi_analysis import (
+    InvalidMoveError, RodState, analyse_game, analyse_games, analyse_moves, leaderboard, parse_move_sequence,
+)
+from frame_stewart import FrameStewartSolver
+from hanoi_codec import pack_moves
+from hanoi_solver import HanoiSolver
+from hanoi_testing import setUpModule, tearDownModule  # Temporary table cache
+
+
+# Move string of the optimal solution, as stored by save_game_result()
+def optimal_sequence(num_disks):
+    return ",".join(from_rod + to_rod for from_rod, to_rod in HanoiSolver(num_disks).moves())
+
+
+class TestHanoiAnalysis(unittest.TestCase):
+
+    def test_parse_move_sequence(self):
+        # Test stored strings are split into moves, and junk is rejected
+        self.assertEqual(parse_move_sequence("AC,AB,CB"), [("A", "C"), ("A", "B"), ("C", "B")])
+        self.assertEqual(parse_move_sequence(""), [])
+        with self.assertRaises(InvalidMoveError):
+            parse_move_sequence("AC,AA")
+        with self.assertRaises(InvalidMoveError):
+            parse_move_sequence("AC,XY")
+
+    def test_optimal_game(self):
+        # Test the optimal solution wastes no moves
+        result = analyse_moves(6, optimal_sequence(6))
+        self.assertTrue(result["valid"] and result["solved"])
+        self.assertEqual(result["moves"], 63)
+        self.assertEqual(result["wasted_moves"], 0)
+
+    def test_wasted_moves(self):
+        # Test extra moves and unfinished games are scored against the optimum
+        result = analyse_moves(3, optimal_sequence(3) + ",CB,BC")
+        self.assertTrue(result["solved"])
+        self.assertEqual(result["wasted_moves"], 2)
+
+        result = analyse_moves(3, "AB,BC")  # Smallest disk took two moves to reach C
+        self.assertFalse(result["solved"])
+        self.assertEqual(result["remaining_moves"], 6)
+        self.assertEqual(result["wasted_moves"], 1)
+
+    def test_invalid_move(self):
+        # Test a larger disk on a smaller one is reported with its move number
+        result = analyse_moves(3, "AC,AC")
+        self.assertFalse(result["valid"])
+        self.assertIn("Move 2", result["error"])
+        result = analyse_moves(3, "BC")
+        self.assertIn("rod B is empty", result["error"])
+
+    def test_more_rods(self):
+        # Test 4-rod games are scored against the Frame-Stewart optimum
+        moves = ",".join(a + b for a, b in FrameStewartSolver(5, 4).moves())
+        result = analyse_moves(5, moves, 4)
+        self.assertTrue(result["solved"])
+        self.assertEqual(result["optimal_moves"], 13)
+        self.assertEqual(result["wasted_moves"], 0)
+        self.assertIsNone(analyse_moves(5, "AB", 4)["wasted_moves"])
+        self.assertIn("only has rods A-C", analyse_moves(3, "AD")["error"])
+
+    def test_packed_game(self):
+        # Test records with only packed move_data are analysed too
+        record = {"num_disks": 8, "move_data": pack_moves(HanoiSolver(8).moves(), compress=True)}
+        result = analyse_game(record)
+        self.assertTrue(result["solved"])
+        self.assertEqual(result["moves"], 255)
+        self.assertEqual(result["wasted_moves"], 0)
+        self.assertFalse(analyse_moves(3, b"junk")["valid"])
+
+    def test_damaged_packed_game(self):
+        # Test a corrupted compressed record is reported without stopping the batch
+        data = bytearray(pack_moves(HanoiSolver(12).moves(), compress=True))
+        data[-1] ^= 0xFF
+        records = [{"num_disks": 12, "move_data": bytes(data)},
+                   {"num_disks": 12, "move_data": pack_moves(HanoiSolver(12).moves(), compress=True)}]
+        results = analyse_games(records)
+        self.assertFalse(results[0]["valid"])
+        self.assertIn("Damaged compressed moves", results[0]["error"])
+        self.assertTrue(results[1]["solved"])
+
+    def test_min_remaining_moves_on_optimal_path(self):
+        # Test the remaining moves along the optimal path count down to 0
+        solver = HanoiSolver(5)
+        state = RodState(5)
+        self.assertEqual(state.min_remaining_moves(), 31)
+        for move_number, (from_rod, to_rod) in enumerate(solver.moves(), start=1):
+            state.move(move_number, from_rod, to_rod)
+            self.assertEqual(state.min_remaining_moves(), 31 - move_number)
+
+    def test_leaderboard(self):
+        # Test solved games are ranked by wasted moves, then time
+        records = [
+            {"game_id": "1", "player_name": "Slow", "num_disks": 3, "move_sequence": optimal_sequence(3), "time_taken": 50},
+            {"game_id": "2", "player_name": "Fast", "num_disks": 3, "move_sequence": optimal_sequence(3), "time_taken": 10},
+            {"game_id": "3", "player_name": "Wander", "num_disks": 3, "move_sequence": optimal_sequence(3) + ",CB,BC", "time_taken": 5},
+            {"game_id": "4", "player_name": "Quit", "num_disks": 3, "move_sequence": "AC", "time_taken": 1},
+        ]
+        self.assertEqual(len(analyse_games(records)), 4)
+        self.assertEqual(analyse_game(records[3])["player_name"], "Quit")
+        self.assertEqual([result["player_name"] for result in leaderboard(records)], ["Fast", "Slow", "Wander"])
+
+    def test_identical_games_get_own_results(self):
+        # Test identical games share one replay but not one result dict
+        records = [{"game_id": str(i), "num_disks": 4, "move_sequence": optimal_sequence(4)} for i in range(3)]
+        results = analyse_games(records)
+        results[0]["solved"] = False
+        self.assertTrue(results[1]["solved"])
+        self.assertEqual([result["game_id"] for result in results], ["0", "1", "2"])
+        self.assertIsNot(analyse_moves(4, "AB"), analyse_moves(4, "AB"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+import unittest
+from frame_stewart import FrameStewartSolver
+from hanoi_codec import MoveCodec, iter_moves, pack_moves, replay
+from hanoi_solver import HanoiSolver
+from hanoi_testing import setUpModule, tearDownModule  # Temporary table cache
+
+
+class TestHanoiCodec(unittest.TestCase):
+
+    def test_bits_per_move(self):
+        # Test 6 moves on 3 rods take 3 bits, 12 on 4 rods take 4 bits
+        self.assertEqual(MoveCodec(3).bits, 3)
+        self.assertEqual(MoveCodec(4).bits, 4)
+        self.assertEqual(MoveCodec(8).bits, 6)
+
+    def test_round_trip(self):
+        # Test packed moves decode to the same moves for every rod count
+        for num_rods in range(3, 9):
+            for num_disks in range(0, 8):
+                moves = list(FrameStewartSolver(num_disks, num_rods).moves())
+                for compress in (False, True):
+                    data = pack_moves(moves, num_rods, compress)
+                    self.assertEqual(list(iter_moves(data)), moves, (num_rods, num_disks, compress))
+
+    def test_size(self):
+        # Test 3 moves fit in 3 bytes after the header, and 8 moves still do
+        self.assertEqual(pack_moves([("A", "C"), ("A", "B"), ("C", "B")]), bytes([1, 3, 0, 0x22, 0xE0, 0x00]))
+        self.assertEqual(len(pack_moves(HanoiSolver(10).moves())), 3 + (1023 + 1 + 7) // 8 * 3)
+
+    def test_streaming(self):
+        # Test the stream can be decoded from small chunks, split anywhere
+        moves = list(HanoiSolver(9).moves())
+        for compress in (False, True):
+            chunks = list(MoveCodec().encode(moves, compress, chunk_moves=16))
+            self.assertGreater(len(chunks), 2)
+            data = b"".join(chunks)
+            self.assertEqual(list(iter_moves(chunks)), moves)
+            self.assertEqual(list(iter_moves(data[i:i + 5] for i in range(0, len(data), 5))), moves)
+
+    def test_replay(self):
+        # Test a packed game can be replayed and compression shrinks long games
+        data = pack_moves(HanoiSolver(16).moves(), compress=True)
+        self.assertLess(len(data), 5000)
+        self.assertTrue(replay(data, 16).is_solved())
+        self.assertFalse(replay(pack_moves([("A", "B")]), 2).is_solved())
+
+    def test_invalid_data(self):
+        # Test bad moves and damaged data are rejected
+        with self.assertRaises(ValueError):
+            pack_moves([("A", "D")])
+        with self.assertRaises(ValueError):
+            list(iter_moves(b"junk"))
+        with self.assertRaises(ValueError):
+            list(iter_moves(pack_moves([("A", "B")] * 9)[:-3]))
+        data = bytearray(pack_moves([("A", "B")] * 16))
+        data[3] = 0xFF  # Codes 7, beyond the end code 6
+        with self.assertRaises(ValueError):
+            list(iter_moves(bytes(data)))
+
+    def test_damaged_compressed_data(self):
+        # Test a corrupted zlib payload raises ValueError, not zlib.error
+        data = bytearray(pack_moves(HanoiSolver(12).moves(), compress=True))
+        data[-1] ^= 0xFF  # Breaks the zlib checksum
+        with self.assertRaises(ValueError):
+            list(iter_moves(bytes(data)))
+        data[len(data) // 2] ^= 0xFF
+        with self.assertRaises(ValueError):
+            list(iter_moves(bytes(data)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+import unittest
+from hanoi_engine import HanoiEngine, benchmark
+from hanoi_solver import HanoiSolver
+
+
+class TestHanoiEngine(unittest.TestCase):
+
+    def test_new_game(self):
+        # Test all disks start on rod A
+        engine = HanoiEngine(3)
+        self.assertEqual(engine.rods, {"A": [3, 2, 1], "B": [], "C": []})
+        self.assertEqual(engine.top_disk("A"), 1)
+        self.assertIsNone(engine.top_disk("B"))
+        self.assertFalse(engine.is_solved())
+
+    def test_moves(self):
+        # Test valid moves are made and recorded, invalid ones are refused
+        engine = HanoiEngine(3)
+        self.assertTrue(engine.move("A", "C"))
+        self.assertFalse(engine.move("A", "C"))  # Disk 2 on disk 1
+        self.assertFalse(engine.move("B", "A"))  # Empty rod
+        self.assertFalse(engine.move("C", "C"))
+        self.assertTrue(engine.move("A", "B"))
+        self.assertEqual(engine.rods, {"A": [3], "B": [2], "C": [1]})
+        self.assertEqual(engine.move_sequence, [("A", "C"), ("A", "B")])
+        self.assertEqual(engine.num_moves, 2)
+        self.assertEqual(engine.rod_height("A"), 1)
+
+    def test_rods_setter(self):
+        # Test a position can be set directly, as the Tk tests do
+        engine = HanoiEngine(3)
+        engine.rods = {"A": [], "B": [3], "C": [2, 1]}
+        self.assertEqual(engine.disk_below(1), 2)
+        self.assertEqual(engine.disk_position(1), ("C", 1))
+        self.assertEqual(engine.disk_position(3), ("B", 0))
+        self.assertIsNone(engine.disk_below(2))
+        self.assertFalse(engine.is_valid_move("B", "C"))
+        engine.rods = {"A": [], "B": [], "C": [3, 2, 1]}
+        self.assertTrue(engine.is_solved())
+        engine.rods = {"A": [], "B": [], "C": [4, 3, 2, 1]}
+        self.assertEqual(engine.num_disks, 4)
+        self.assertTrue(engine.is_solved())
+        engine.rods = {"A": [2, 1], "B": [], "C": []}
+        self.assertEqual(engine.num_disks, 2)
+        self.assertFalse(engine.is_solved())
+        for rods in ({"A": [3, 1]}, {"A": [2, 1], "C": [1]}, {"A": [1, 2]}, {"D": [1]}):
+            with self.assertRaises(ValueError):
+                engine.rods = rods
+
+    def test_rods_view_writes_back(self):
+        # Test list changes made through rods reach the engine
+        engine = HanoiEngine(3)
+        rods = engine.rods
+        self.assertEqual(rods["A"].pop(), 1)
+        engine.rods["C"].append(1)
+        self.assertEqual(engine.rods, {"A": [3, 2], "B": [], "C": [1]})
+        self.assertEqual(engine.top_disk("C"), 1)
+        self.assertEqual(engine.rods["A"].pop(), 2)
+        engine.rods["B"] = [2]
+        self.assertEqual(engine.rods["A"], [3])
+        self.assertEqual(engine.rods["B"], [2])
+        with self.assertRaises(ValueError):
+            engine.rods["C"].append(3)
+        with self.assertRaises(IndexError):
+            HanoiEngine(0).rods["A"].pop()
+
+    def test_play(self):
+        # Test a batch of moves stops at the first invalid move
+        engine = HanoiEngine(10)
+        self.assertEqual(engine.play(HanoiSolver(10).moves()), 1023)
+        self.assertTrue(engine.is_solved())
+
+        engine.reset()
+        self.assertEqual(engine.play([("A", "B"), ("A", "B"), ("A", "C")]), 1)
+        self.assertEqual(engine.move_sequence, [("A", "B")])
+
+    def test_benchmark(self):
+        # Test the benchmark replays the optimal solution
+        result = benchmark(12)
+        self.assertEqual(result["moves"], 4095)
+        self.assertTrue(result["solved"])
+
+    def test_invalid_size(self):
+        # Test a negative number of disks is rejected
+        with self.assertRaises(ValueError):
+            HanoiEngine(-1)
+
+
+if __name__ == "__main__":
+    unittest.main()
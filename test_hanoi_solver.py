@@ -0,0 +1,97 @@
+import unittest
+from itertools import islice
+from hanoi_solver import HanoiSolver, benchmark
+
+
+# Play the moves on real rods and return the rods at the end
+def replay(num_disks, moves):
+    rods = {"A": list(range(num_disks, 0, -1)), "B": [], "C": []}
+    for from_rod, to_rod in moves:
+        disk = rods[from_rod].pop()
+        if rods[to_rod] and rods[to_rod][-1] < disk:
+            raise AssertionError(f"Disk {disk} placed on disk {rods[to_rod][-1]}")
+        rods[to_rod].append(disk)
+    return rods
+
+
+class TestHanoiSolver(unittest.TestCase):
+
+    def test_strategies_agree_and_solve(self):
+        # Test every strategy gives the same optimal, legal solution
+        for num_disks in range(0, 11):
+            solver = HanoiSolver(num_disks)
+            moves = list(solver.moves("recursive"))
+            self.assertEqual(len(moves), 2 ** num_disks - 1)
+            self.assertEqual(replay(num_disks, moves)["C"], list(range(num_disks, 0, -1)))
+            for strategy in HanoiSolver.STRATEGIES:
+                self.assertEqual(list(solver.moves(strategy)), moves, (strategy, num_disks))
+
+    def test_known_moves(self):
+        # Test the 3-disk solution
+        expected = [("A", "C"), ("A", "B"), ("C", "B"), ("A", "C"), ("B", "A"), ("B", "C"), ("A", "C")]
+        self.assertEqual(list(HanoiSolver(3).moves()), expected)
+
+    def test_custom_rods(self):
+        # Test the rods can be renamed
+        self.assertEqual(list(HanoiSolver(1, "X", "Y", "Z").moves("iterative")), [("X", "Z")])
+
+    def test_streams_64_disks(self):
+        # Test 64 disks are streamed lazily
+        solver = HanoiSolver(64)
+        self.assertEqual(solver.move_count(), 2 ** 64 - 1)
+        for strategy in HanoiSolver.STRATEGIES:
+            first = list(islice(solver.moves(strategy), 5))
+            self.assertEqual(first, [("A", "B"), ("A", "C"), ("B", "C"), ("A", "B"), ("C", "A")])
+
+    def test_kth_move_and_state_after(self):
+        # Test random access agrees with replaying the solution move by move
+        solver = HanoiSolver(7)
+        rods = {"A": list(range(7, 0, -1)), "B": [], "C": []}
+        self.assertEqual(solver.state_after(0), rods)
+        for k, move in enumerate(solver.moves(), start=1):
+            self.assertEqual(solver.kth_move(k), move)
+            rods = replay(7, islice(solver.moves(), k))
+            self.assertEqual(solver.state_after(k), rods)
+            self.assertEqual(solver.progress(rods), k)
+
+    def test_gray_moves_from_the_middle(self):
+        # Test the Gray-code moves can start after any number of moves
+        moves = list(HanoiSolver(6).moves())
+        for start in (0, 1, 31, 62, 63):
+            self.assertEqual(list(HanoiSolver(6).gray_moves(start)), moves[start:])
+
+    def test_random_access_64_disks(self):
+        # Test queries on 64 disks with big move numbers
+        solver = HanoiSolver(64)
+        self.assertEqual(solver.kth_move(2 ** 63), ("A", "C"))
+        state = solver.state_after(2 ** 63)
+        self.assertEqual(state["C"], [64])
+        self.assertEqual(state["B"], list(range(63, 0, -1)))
+        self.assertEqual(solver.progress(state), 2 ** 63)
+
+    def test_progress_off_the_optimal_path(self):
+        # Test positions the optimal solution never visits
+        solver = HanoiSolver(2)
+        self.assertIsNone(solver.progress({"A": [1], "B": [2], "C": []}))
+        self.assertIsNone(solver.progress({"A": [2], "B": [], "C": []}))
+        with self.assertRaises(ValueError):
+            solver.kth_move(0)
+        with self.assertRaises(ValueError):
+            solver.state_after(4)
+
+    def test_invalid_input(self):
+        # Test bad disk counts and strategy names are rejected
+        with self.assertRaises(ValueError):
+            HanoiSolver(-1)
+        with self.assertRaises(ValueError):
+            HanoiSolver(3).moves("magic")
+
+    def test_benchmark(self):
+        # Test the benchmark reports one row per strategy
+        results = benchmark(8, limit=100)
+        self.assertEqual([row["strategy"] for row in results], list(HanoiSolver.STRATEGIES))
+        self.assertTrue(all(row["moves"] == 100 for row in results))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from game_logic import NQueensGame
+from nqueens import is_solution
+from nqueens.hints import HintService, complete_placement, placement_from_board, SOLVABLE, UNSOLVABLE, UNKNOWN
+
+
+class TestHints(unittest.TestCase):
+
+    def test_complete_placement_keeps_queens(self):
+        # Test a completion keeps the placed queens, whatever rows they are in
+        placement = [-1] * 16
+        placement[3], placement[9], placement[15] = 7, 0, 12
+        solution = complete_placement(placement)
+        self.assertTrue(is_solution(solution))
+        self.assertEqual((solution[3], solution[9], solution[15]), (7, 0, 12))
+
+    def test_unsolvable_placement(self):
+        # Test no 8-queens solution starts with columns 0, 2
+        self.assertIsNone(complete_placement([0, 2, -1, -1, -1, -1, -1, -1]))
+        self.assertIsNone(complete_placement([-1, -1, -1]))
+
+    def test_hint_for_live_game(self):
+        # Test a hint from an NQueensGame board, and following hints to the end
+        game = NQueensGame(16)
+        game.place_or_remove_queen(5, 5)
+        service = HintService()
+        while game.queens_left:
+            result = service.hint(game.board)
+            self.assertEqual(result["status"], SOLVABLE)
+            self.assertTrue(game.place_or_remove_queen(*result["square"]))
+        self.assertTrue(is_solution(game.columns))
+
+    def test_hint_is_cached(self):
+        # Test repeated requests on the same position return the cached result
+        game = NQueensGame(8)
+        game.place_or_remove_queen(0, 0)
+        game.place_or_remove_queen(1, 2)
+        service = HintService()
+        result = service.hint(game.board)
+        self.assertEqual(result["status"], UNSOLVABLE)
+        self.assertEqual(service.hint(game.board), result)
+        self.assertIn(placement_from_board(game.board), service.cache)
+
+    def test_results_are_copies(self):
+        # Test changing a returned result does not change the cached one
+        game = NQueensGame(8)
+        game.place_or_remove_queen(0, 0)
+        service = HintService()
+        result = service.hint(game.board)
+        result["solution"][0] = 5
+        result["status"] = UNSOLVABLE
+        again = service.hint(game.board)
+        self.assertEqual(again["status"], SOLVABLE)
+        self.assertEqual(again["solution"][0], 0)
+
+    def test_concurrent_hints(self):
+        # Test hints requested from several threads at once fill one consistent cache
+        boards = []
+        for col in range(8):
+            game = NQueensGame(8)
+            game.place_or_remove_queen(0, col)
+            boards.append(game.board)
+        service = HintService(cache_size=4)
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(service.hint, boards * 5))
+        self.assertTrue(all(result["status"] == SOLVABLE for result in results))
+        self.assertEqual(len(service.cache), 4)
+
+    def test_time_budget(self):
+        # Test a search that runs out of time is reported and not cached
+        service = HintService(time_budget=0)
+        result = service.hint([[0] * 8 for _ in range(8)])
+        self.assertEqual(result["status"], UNKNOWN)
+        self.assertEqual(len(service.cache), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
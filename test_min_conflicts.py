@@ -0,0 +1,46 @@
+import unittest
+import numpy as np
+from nqueens import is_solution, solve_min_conflicts
+from nqueens.min_conflicts import MinConflictsSolver
+from batch_validator import validate_boards
+
+
+class TestMinConflicts(unittest.TestCase):
+
+    def test_small_boards(self):
+        # Test every small board gets a valid solution, and n=2, n=3 get None
+        for n in range(1, 30):
+            solution = solve_min_conflicts(n, seed=n)
+            if n in (2, 3):
+                self.assertIsNone(solution)
+            else:
+                self.assertEqual(len(solution), n)
+                self.assertTrue(is_solution(solution), n)
+
+    def test_large_board(self):
+        # Test a board far beyond backtracking range with the vectorized validator
+        solution = solve_min_conflicts(5000, seed=0)
+        self.assertTrue(validate_boards(np.array([solution]))[0])
+
+    def test_seed_is_reproducible(self):
+        # Test the same seed gives the same solution
+        self.assertEqual(solve_min_conflicts(200, seed=7), solve_min_conflicts(200, seed=7))
+
+    def test_conflict_count_matches_board(self):
+        # Test the incremental conflict count after the greedy start
+        solver = MinConflictsSolver(300, seed=1)
+        solver.initial_placement()
+        queens = list(solver.queens)
+        pairs = sum(1 for i in range(300) for j in range(i)
+                    if abs(queens[i] - queens[j]) == i - j)
+        self.assertEqual(solver.conflicts, pairs)
+        self.assertEqual(sorted(queens), list(range(300)))
+
+    def test_invalid_size(self):
+        # Test a non-positive board size is rejected
+        with self.assertRaises(ValueError):
+            MinConflictsSolver(0)
+
+
+if __name__ == "__main__":
+    unittest.main()
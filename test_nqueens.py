@@ -0,0 +1,75 @@
+import csv
+import json
+import os
+import tempfile
+import unittest
+import types
+from nqueens import STRATEGIES, Strategy, get_strategy, is_solution
+from nqueens.benchmark import run_benchmark, fastest_strategy, write_csv, write_json, main
+
+# Known number of solutions for n = 1..8
+KNOWN_COUNTS = [1, 0, 0, 2, 10, 4, 40, 92]
+
+
+class TestStrategies(unittest.TestCase):
+
+    def test_every_strategy_counts(self):
+        # Test count() and solutions() of every strategy against the known counts
+        for name in STRATEGIES:
+            options = {"workers": 2} if name == "multiprocess" else {}
+            strategy = get_strategy(name, **options)
+            for n, expected in enumerate(KNOWN_COUNTS, start=1):
+                self.assertEqual(strategy.count(n), expected, (name, n))
+            solutions = list(strategy.solutions(8))
+            self.assertEqual(len(solutions), 92)
+            self.assertEqual(len(set(map(tuple, solutions))), 92)
+            self.assertTrue(all(is_solution(solution) for solution in solutions))
+
+    def test_strategies_stream(self):
+        # Test solutions() is a generator and the base class cannot be used as is
+        for name in ("recursive", "bitmask", "iterative"):
+            self.assertIsInstance(get_strategy(name).solutions(8), types.GeneratorType)
+        with self.assertRaises(TypeError):
+            Strategy()
+
+    def test_unknown_strategy(self):
+        # Test an unknown strategy name is rejected
+        with self.assertRaises(ValueError):
+            get_strategy("quantum")
+
+
+class TestBenchmark(unittest.TestCase):
+
+    def test_run_and_write(self):
+        # Test the benchmark results and their CSV and JSON files
+        results = run_benchmark(["bitmask", "iterative"], sizes=range(4, 7))
+        self.assertEqual(len(results), 6)
+        self.assertEqual([row["solutions"] for row in results[:3]], [2, 10, 4])
+        self.assertIn(fastest_strategy(results, 6), ("bitmask", "iterative"))
+        self.assertIsNone(fastest_strategy(results, 20))
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            csv_path = os.path.join(tmp_dir, "results.csv")
+            json_path = os.path.join(tmp_dir, "results.json")
+            write_csv(results, csv_path)
+            write_json(results, json_path)
+            with open(csv_path, newline="") as file:
+                self.assertEqual(len(list(csv.DictReader(file))), 6)
+            with open(json_path) as file:
+                self.assertEqual(json.load(file), results)
+
+    def test_time_budget(self):
+        # Test a strategy is skipped for larger sizes once it runs over budget
+        results = run_benchmark(["recursive"], sizes=range(4, 9), time_budget=0)
+        self.assertEqual(len(results), 1)
+
+    def test_command_line(self):
+        # Test the command line entry point
+        results = main(["--sizes", "4", "5", "--strategies", "symmetry", "--mode", "solutions"])
+        self.assertEqual([row["solutions"] for row in results], [2, 10])
+        results = main(["--min-conflicts", "50", "100"])
+        self.assertEqual([row["n"] for row in results], [50, 100])
+
+
+if __name__ == "__main__":
+    unittest.main()
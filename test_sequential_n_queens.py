@@ -0,0 +1,76 @@
+import unittest
+from sequential_n_queens import (
+    solve_n_queens, is_safe, solve_canonical, expand_symmetries, is_canonical,
+    iter_solutions, pack_solution, unpack_solution,
+)
+
+# Known number of solutions for n = 1..10
+KNOWN_COUNTS = [1, 0, 0, 2, 10, 4, 40, 92, 352, 724]
+# Known number of solutions up to rotation and reflection for n = 1..10
+KNOWN_UNIQUE_COUNTS = [1, 0, 0, 1, 2, 1, 6, 12, 46, 92]
+
+
+class TestSequentialNQueens(unittest.TestCase):
+
+    def test_solution_counts(self):
+        # Test both engines against the known solution counts
+        for n, expected in enumerate(KNOWN_COUNTS, start=1):
+            self.assertEqual(len(solve_n_queens(n, engine="recursive")), expected)
+            self.assertEqual(len(solve_n_queens(n, engine="bitmask")), expected)
+
+    def test_engines_agree(self):
+        # Test the bitmask engine yields the same solutions in the same order
+        self.assertEqual(solve_n_queens(8, engine="bitmask"), solve_n_queens(8, engine="recursive"))
+
+    def test_solutions_are_valid(self):
+        # Test every queen of every solution is safe from the ones above it
+        for solution in solve_n_queens(8):
+            for row, col in enumerate(solution):
+                self.assertTrue(is_safe(row, col, solution))
+
+    def test_canonical_counts(self):
+        # Test the symmetry-reduced search finds one solution per symmetry class
+        for n, expected in enumerate(KNOWN_UNIQUE_COUNTS, start=1):
+            canonical = solve_canonical(n)
+            self.assertEqual(len(canonical), expected)
+            self.assertTrue(all(is_canonical(solution) for solution in canonical))
+
+    def test_symmetry_expansion(self):
+        # Test expanding the canonical solutions gives back every solution exactly once
+        for n in range(0, 11):
+            expanded = [solution for canonical in solve_canonical(n) for solution in expand_symmetries(canonical)]
+            self.assertEqual(sorted(expanded), solve_n_queens(n))
+            self.assertEqual(sorted(solve_n_queens(n, engine="symmetry")), solve_n_queens(n))
+
+    def test_iter_solutions(self):
+        # Test the generator yields the same solutions as the list API for every engine
+        for engine in ("recursive", "bitmask"):
+            for n in range(0, 9):
+                self.assertEqual(list(iter_solutions(n, engine)), solve_n_queens(n, engine))
+        self.assertEqual(sorted(iter_solutions(8, "symmetry")), solve_n_queens(8))
+        self.assertEqual(list(iter_solutions(0, "symmetry")), [[]])
+
+    def test_iter_solutions_is_lazy(self):
+        # Test solutions come out one at a time without finishing the search
+        solutions = iter_solutions(20)
+        first = next(solutions)
+        self.assertEqual(len(first), 20)
+        self.assertTrue(all(is_safe(row, col, first) for row, col in enumerate(first)))
+
+    def test_packed_solutions(self):
+        # Test the packed form is one byte per row and round-trips
+        packed = list(iter_solutions(8, packed=True))
+        self.assertTrue(all(isinstance(p, bytes) and len(p) == 8 for p in packed))
+        self.assertEqual([unpack_solution(p) for p in packed], solve_n_queens(8))
+        self.assertEqual(pack_solution([1, 3, 0, 2]), bytes([1, 3, 0, 2]))
+
+    def test_unknown_engine(self):
+        # Test an unknown engine name is rejected
+        with self.assertRaises(ValueError):
+            solve_n_queens(4, engine="quantum")
+        with self.assertRaises(ValueError):
+            iter_solutions(4, engine="quantum")
+
+
+if __name__ == "__main__":
+    unittest.main()
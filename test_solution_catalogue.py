@@ -0,0 +1,66 @@
+import os
+import tempfile
+import unittest
+from sequential_n_queens import solve_n_queens
+from solution_catalogue import (
+    SolutionCatalogue, build_catalogue, encode_solution, decode_solution, open_catalogue,
+)
+
+
+class TestSolutionCatalogue(unittest.TestCase):
+
+    def setUp(self):
+        # Build a small catalogue in a temporary directory
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp_dir.name, "nqueens8.cat")
+        build_catalogue(8, self.path, workers=1)
+        self.catalogue = SolutionCatalogue(self.path)
+
+    def tearDown(self):
+        self.catalogue.close()
+        self.tmp_dir.cleanup()
+
+    def test_encoding_round_trip(self):
+        # Test records decode back to the same solution and keep the sort order
+        for n in (5, 8, 17):
+            solutions = solve_n_queens(n) if n < 17 else [list(range(17))]
+            records = [encode_solution(solution) for solution in solutions]
+            self.assertEqual([decode_solution(record, n) for record in records], solutions)
+            self.assertEqual(records, sorted(records))
+
+    def test_contents(self):
+        # Test the catalogue holds every solution in sorted order
+        solutions = solve_n_queens(8)
+        self.assertEqual(len(self.catalogue), 92)
+        self.assertEqual([self.catalogue[i] for i in range(92)], solutions)
+        for index, solution in enumerate(solutions):
+            self.assertEqual(self.catalogue.index(solution), index)
+
+    def test_invalid_boards(self):
+        # Test boards that are not solutions are not found
+        self.assertIsNone(self.catalogue.index(list(range(8))))
+        self.assertIsNone(self.catalogue.index([0, 4, 7, 5, 2, 6, 1]))
+        self.assertIsNone(self.catalogue.index([0, 4, 7, 5, 2, 6, 1, 99]))
+        self.assertNotIn([-1] * 8, self.catalogue)
+
+    def test_claim(self):
+        # Test a solution can only be claimed once and the bitmap persists
+        solution = solve_n_queens(8)[10]
+        self.assertTrue(self.catalogue.claim(solution))
+        self.assertFalse(self.catalogue.claim(solution))
+        self.assertFalse(self.catalogue.claim(list(range(8))))
+        self.assertEqual(self.catalogue.found_count(), 1)
+
+        self.catalogue.close()
+        self.catalogue = open_catalogue(self.path)
+        self.assertTrue(self.catalogue.is_found(10))
+        self.catalogue.reset_found()
+        self.assertEqual(self.catalogue.found_count(), 0)
+
+    def test_missing_catalogue(self):
+        # Test opening a catalogue that was never built
+        self.assertIsNone(open_catalogue(os.path.join(self.tmp_dir.name, "missing.cat")))
+
+
+if __name__ == "__main__":
+    unittest.main()
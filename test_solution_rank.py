@@ -0,0 +1,57 @@
+import os
+import tempfile
+import unittest
+from sequential_n_queens import solve_n_queens
+from solution_catalogue import SolutionCatalogue, build_catalogue
+from sequential_n_queens import solution_to_record, record_to_solution
+from solution_rank import MAX_TREE_N, rank_solution, unrank_solution
+
+
+class TestSolutionRank(unittest.TestCase):
+
+    def test_rank_is_enumeration_order(self):
+        # Test ranks follow the order of solve_n_queens
+        for n in range(1, 10):
+            for index, solution in enumerate(solve_n_queens(n)):
+                self.assertEqual(rank_solution(solution), index)
+                self.assertEqual(unrank_solution(n, index), solution)
+
+    def test_invalid_input(self):
+        # Test boards that are not solutions and ranks out of range are rejected
+        with self.assertRaises(ValueError):
+            rank_solution([0, 1, 2, 3])
+        with self.assertRaises(ValueError):
+            unrank_solution(8, 92)
+        with self.assertRaises(ValueError):
+            unrank_solution(8, -1)
+
+    def test_large_boards_need_catalogue(self):
+        # Test boards too big to rank by counting subtrees are refused
+        with self.assertRaises(ValueError):
+            rank_solution(list(range(MAX_TREE_N + 1)))
+        with self.assertRaises(ValueError):
+            unrank_solution(16, 0)
+
+    def test_ranked_records(self):
+        # Test a ranked record stores only the rank and reads back to the board
+        for rank, solution in enumerate(solve_n_queens(8)):
+            record = solution_to_record(solution, rank)
+            self.assertEqual(record, {"n": 8, "rank": rank})
+            self.assertEqual(record_to_solution(record), solution)
+            self.assertEqual(record_to_solution(solution_to_record(solution)), solution)
+
+    def test_with_catalogue(self):
+        # Test ranking through a catalogue gives the same ranks
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "nqueens6.cat")
+            build_catalogue(6, path, workers=1)
+            with SolutionCatalogue(path) as catalogue:
+                for index, solution in enumerate(solve_n_queens(6)):
+                    self.assertEqual(rank_solution(solution, catalogue), index)
+                    self.assertEqual(unrank_solution(6, index, catalogue), solution)
+                with self.assertRaises(ValueError):
+                    rank_solution([0, 1, 2, 3, 4, 5], catalogue)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,56 @@
+import unittest
+from sequential_n_queens import solve_n_queens
+from sequential_n_queens import count_n_queens, count_stack
+from nqueens.core import SOLUTION_COUNTS
+from threaded_n_queens import compare_with_sequential, generate_prefixes, solve_prefix, solve_n_queens_parallel, count_n_queens_parallel, count_prefix
+
+# Known number of solutions for n = 0..11
+KNOWN_COUNTS = [1, 1, 0, 0, 2, 10, 4, 40, 92, 352, 724, 2680]
+
+
+class TestParallelNQueens(unittest.TestCase):
+
+    def test_prefixes_are_disjoint(self):
+        # Test the prefixes cover the tree without overlapping
+        prefixes = generate_prefixes(8, 2)
+        self.assertEqual(len(prefixes), len(set(map(tuple, prefixes))))
+        total = sum(len(solve_prefix(8, prefix)) for prefix in prefixes)
+        self.assertEqual(total, 92)
+
+    def test_matches_sequential(self):
+        # Test the merged result equals the sequential result, in order and without duplicates
+        for n in range(1, 9):
+            self.assertEqual(solve_n_queens_parallel(n, workers=2), solve_n_queens(n))
+
+    def test_prefix_depth(self):
+        # Test the result does not depend on how the tree is split
+        expected = solve_n_queens(7)
+        for depth in (1, 2, 3, 7):
+            self.assertEqual(solve_n_queens_parallel(7, workers=2, prefix_depth=depth), expected)
+
+    def test_count_only(self):
+        # Test the count-only solvers against the known counts
+        for n, expected in enumerate(KNOWN_COUNTS):
+            self.assertEqual(count_n_queens(n), expected)
+            self.assertEqual(count_stack(n), expected)
+        for n in (1, 4, 7, 8, 11):
+            self.assertEqual(count_n_queens_parallel(n, workers=2), KNOWN_COUNTS[n])
+
+    def test_published_counts(self):
+        # Test the stored counts used by FindAllSolutions match the solver
+        for n in range(13):
+            self.assertEqual(SOLUTION_COUNTS[n], count_n_queens(n))
+
+    def test_count_prefix(self):
+        # Test prefix counts agree with the solutions found for each prefix
+        for prefix in generate_prefixes(9, 3):
+            self.assertEqual(count_prefix(9, prefix), len(solve_prefix(9, prefix)))
+
+    def test_compare_with_sequential(self):
+        # Test the benchmark compares counts, not solution lists
+        count, sequential_time, parallel_time = compare_with_sequential(8, workers=2)
+        self.assertEqual(count, 92)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,80 +1,51 @@
-import threading
+import sys
 import time
-from firebase_config import db
-
-# Function to check if a queen can be placed on board[row][col]
-def is_safe(board, row, col, n):
-    for i in range(col):
-        if board[row][i] == 1:
-            return False
-    for i, j in zip(range(row, -1, -1), range(col, -1, -1)):
-        if board[i][j] == 1:
-            return False
-    for i, j in zip(range(row, n, 1), range(col, -1, -1)):
-        if board[i][j] == 1:
-            return False
-    return True
-
-# Recursive function to solve problem
-def solve_queens(board, col, solutions, n):
-    if col >= n:
-        solution = [(i, row.index(1)) for i, row in enumerate(board)]
-        solutions.append(solution)
-        return True
-    
-    res = False
-    for i in range(n):
-        if is_safe(board, i, col, n):
-            board[i][col] = 1
-            res = solve_queens(board, col + 1, solutions, n) or res
-            board[i][col] = 0
-    
-    return res
-
-# Thread worker function
-def find_solutions(thread_id, solutions, n):
-    board = [[0]*n for _ in range(n)]
-    solve_queens(board, 0, solutions, n)
+from sequential_n_queens import count_n_queens
+from nqueens.core import generate_prefixes, solve_prefix, count_prefix
+from nqueens.parallel import count_n_queens_parallel, solve_n_queens_parallel
+from firestore_batch import save_in_batches
+
+# Function to time the parallel solver against the sequential one. Both
+# only count, so large n measures the search rather than building and
+# pickling millions of boards.
+def compare_with_sequential(n, workers=None):
+    start_time = time.time()
+    sequential_count = count_n_queens(n)
+    sequential_time = time.time() - start_time
+
+    start_time = time.time()
+    parallel_count = count_n_queens_parallel(n, workers)
+    parallel_time = time.time() - start_time
+
+    if sequential_count != parallel_count:
+        raise RuntimeError(f"Solution counts differ: {sequential_count} != {parallel_count}")
+    return sequential_count, sequential_time, parallel_time
 
 # Function to save solutions to Firestore
 def save_to_firestore(solutions):
-    collection_ref = db.collection('threaded_solutions')
-    for idx, solution in enumerate(solutions):
-        # Convert each solution from a list of tuples to a list of strings
-        solution_str = [f"({row},{col})" for row, col in solution]
-        collection_ref.add({"solution": solution_str})
-        print(f"Solution {idx + 1} saved")
+    from firebase_config import db
+
+    # Convert each solution from a list of columns to a list of strings
+    records = ({"solution": [f"({row},{col})" for row, col in enumerate(solution)]} for solution in solutions)
+    save_in_batches(db, 'threaded_solutions', records, progress=lambda saved: print(f"{saved} solutions saved"))
 
-def main():
-    n = 8
-    solutions = []
-    threads = []
+def main(n=8, benchmark_up_to=None):
+    # Report the real speedup over the sequential solver
+    for size in range(4, (benchmark_up_to or n) + 1):
+        count, sequential_time, parallel_time = compare_with_sequential(size)
+        speedup = sequential_time / parallel_time if parallel_time else float("inf")
+        print(f"n={size}: {count} solutions, sequential {sequential_time:.2f}s, "
+              f"parallel {parallel_time:.2f}s, speedup {speedup:.2f}x")
 
     # Start time for finding solutions
     find_start_time = time.time()
 
-    # Create and start 4 threads separately
-    thread1 = threading.Thread(target=find_solutions, args=(1, solutions, n))
-    thread2 = threading.Thread(target=find_solutions, args=(2, solutions, n))
-    thread3 = threading.Thread(target=find_solutions, args=(3, solutions, n))
-    thread4 = threading.Thread(target=find_solutions, args=(4, solutions, n))
-
-    threads.extend([thread1, thread2, thread3, thread4])
-
-    # Start all threads
-    for thread in threads:
-        thread.start()
-
-    # Wait for all threads to complete
-    for thread in threads:
-        thread.join()
+    # Each worker process solves a disjoint part of the search tree
+    distinct_solutions = solve_n_queens_parallel(n)
 
     # End time for finding solutions
     find_end_time = time.time()
 
-    # Save distinct solutions to Firestore
-    distinct_solutions = list(set(tuple(sol) for sol in solutions))
-
     # Start time for saving solutions
     save_start_time = time.time()
     save_to_firestore(distinct_solutions)
@@ -91,4 +62,5 @@ def main():
     print(f"Total time taken: {total_time_taken} seconds")
 
 if __name__ == "__main__":
-    main()
+    # Optional argument: largest n to benchmark, e.g. 16
+    main(benchmark_up_to=int(sys.argv[1]) if len(sys.argv) > 1 else None)